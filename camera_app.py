@@ -21,31 +21,454 @@ Workflow:
 """
 
 import sys
-import json
 import os
+import time
 import datetime
+import threading
+import queue
+import collections
+import itertools
+import re
+from contextlib import contextmanager
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QComboBox, QTextEdit, QGroupBox, QMessageBox, QSizePolicy,
+    QPushButton, QLabel, QComboBox, QPlainTextEdit, QGroupBox, QMessageBox, QSizePolicy,
     QDoubleSpinBox, QLineEdit, QScrollArea
 )
-from PySide6.QtCore import Qt, Slot, QPoint, QTimer
-from PySide6.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QIcon
+from PySide6.QtCore import (
+    Qt, Slot, Signal, QObject, QEvent, QTimer, QRunnable, QThread, QThreadPool, QSignalBlocker
+)
+from PySide6.QtGui import QImage, QPixmap, QIcon, QGuiApplication
 import logging
+import logging.handlers
+
+from ctypes import CFUNCTYPE, byref, c_double, c_uint, c_void_p
+
+# SDK bindings (IMVApi) and the modules depending on them (camera_worker,
+# camera_config) are imported on first use, so the window shows up before
+# the vendor DLL is loaded. See load_sdk(). json is only needed by rare user
+# actions and is imported in the functions using it.
+SDK_PATH = "C:/Program Files/HuarayTech/MV Viewer/Development/Samples/Python/IMV/MVSDK"
+IMV = None  # IMVApi module, set by load_sdk()
+
+def load_sdk():
+    """
+    Import the IMVApi SDK module on first call and cache it in IMV.
+
+    Returns:
+        module: The IMVApi module
+    """
+    global IMV
+    if IMV is None:
+        if "IMVApi" not in sys.modules:
+            sys.path.append(SDK_PATH)
+        import IMVApi
+        IMV = IMVApi
+    return IMV
+
+def setup_logging(log_file='camera_app.log', level=logging.WARNING):
+    """
+    Configure the root logger to write through a background QueueListener.
+
+    Log records are put on a queue by a QueueHandler and written to the file
+    by the listener thread, so logging calls in Qt slots never block on disk I/O.
+
+    Args:
+        log_file: Path of the application log file
+        level: Root logger level
+
+    Returns:
+        QueueListener: Started listener (call stop() on exit to flush), or None
+        if the root logger is already configured
+    """
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return None
 
-# Import SDK and custom modules
-from camera_worker import CameraWorker
-from camera_config import CameraConfig
-from ctypes import *
+    log_queue = queue.Queue(-1)
+    file_handler = logging.FileHandler(log_file, mode='w')
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
 
-sys.path.append("C:/Program Files/HuarayTech/MV Viewer/Development/Samples/Python/IMV/MVSDK")
-from IMVApi import *
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(level)
+    return listener
 
 def resource_path(relative_path):
     if hasattr(sys, '_MEIPASS'):
         return os.path.join(sys._MEIPASS, relative_path)
     return os.path.join(os.path.abspath("."), relative_path)
 
+
+# Application-wide stylesheet, parsed once in main(). Widgets that change
+# appearance at runtime switch a dynamic property instead of calling
+# setStyleSheet again.
+APP_STYLESHEET = """
+QLabel#videoLabel { background-color: #2b2b2b; color: white; }
+QLabel#fpsLabel { background: transparent; color: #00ff00; font-size: 18pt; font-weight: bold; }
+QLabel#temperatureLabel { color: green; font-weight: bold; padding: 5px; }
+QLabel#temperatureLabel[level="warning"] { color: orange; background-color: #fff4e6; }
+QLabel#temperatureLabel[level="critical"] { color: red; background-color: #ffcccc; }
+QLabel#temperatureLabel[level="offline"] { color: red; }
+QPushButton#toggleGrabButton { background-color: #f39c12; color: white; font-weight: bold; padding: 8px; }
+QPushButton#toggleGrabButton:hover { background-color: #e67e22; }
+QPushButton#toggleGrabButton[paused="true"] { background-color: #27ae60; }
+QPushButton#toggleGrabButton[paused="true"]:hover { background-color: #229954; }
+"""
+
+
+class _DeviceCache:
+    """
+    Module-level cache for IMV_EnumDevices results.
+
+    Device enumeration over USB/GigE costs hundreds of ms to seconds, while the
+    set of connected cameras rarely changes between two Refresh clicks. Results
+    younger than TTL seconds are reused; the cache is invalidated whenever the
+    device topology may have changed (connection events, connect/disconnect).
+    """
+
+    TTL = 5.0  # Seconds a cached enumeration stays valid
+
+    lock = threading.Lock()
+    interface_type = None
+    device_list = None
+    timestamp = 0.0
+    labels = {}  # (serialNumber, ipAddress) bytes -> decoded device label
+
+    @classmethod
+    def get(cls, interface_type):
+        """
+        Get the cached device list if it is still fresh.
+
+        Args:
+            interface_type: IMV_EInterfaceType used for enumeration
+
+        Returns:
+            IMV_DeviceList or None if cache is empty or stale
+        """
+        with cls.lock:
+            if (cls.device_list is not None
+                    and cls.interface_type == interface_type
+                    and time.monotonic() - cls.timestamp < cls.TTL):
+                return cls.device_list
+            return None
+
+    @classmethod
+    def store(cls, interface_type, device_list):
+        """Store a fresh enumeration result."""
+        with cls.lock:
+            cls.interface_type = interface_type
+            cls.device_list = device_list
+            cls.timestamp = time.monotonic()
+
+    @classmethod
+    def get_label(cls, device_info):
+        """
+        Get the display label of a device, decoding it only for new devices.
+
+        Args:
+            device_info: IMV_DeviceInfo entry of an enumeration result
+
+        Returns:
+            str: "<vendor> <model> (S/N: <serial>) IP: <ip>"
+        """
+        serial = device_info.serialNumber
+        ip_address = device_info.DeviceSpecificInfo.gigeDeviceInfo.ipAddress
+        label_key = (serial, ip_address)
+        with cls.lock:
+            label = cls.labels.get(label_key)
+            if label is None:
+                # Build the label in bytes and decode once
+                label = (b"%s %s (S/N: %s) IP: %s" % (
+                    device_info.vendorName or b"Unknown",
+                    device_info.modelName or b"Unknown",
+                    serial or b"Unknown",
+                    ip_address or b"N/A"
+                )).decode('utf-8', errors='replace')
+                cls.labels[label_key] = label
+            return label
+
+    @classmethod
+    def invalidate(cls):
+        """Force the next discovery to enumerate devices again."""
+        with cls.lock:
+            cls.timestamp = 0.0
+            cls.labels.clear()
+
+
+class _EnumSignals(QObject):
+    """
+    Signals emitted by _EnumTask (QRunnable itself cannot host signals).
+
+    Signals:
+        finished: Emits (IMV_DeviceList, return code) when enumeration returns
+        failed: Emits error message if enumeration raised an exception
+    """
+
+    finished = Signal(object, int)
+    failed = Signal(str)
+
+
+class _EnumTask(QRunnable):
+    """
+    Background task running IMV_EnumDevices on the global thread pool.
+
+    Devices are enumerated in place into the caller's long-lived
+    IMV_DeviceList. Successful results are stored in _DeviceCache before
+    being emitted.
+    """
+
+    def __init__(self, interface_type, device_list):
+        """
+        Args:
+            interface_type: IMV_EInterfaceType to enumerate
+            device_list: IMV_DeviceList to enumerate into
+        """
+        super().__init__()
+        self.interface_type = interface_type
+        self.device_list = device_list
+        self.signals = _EnumSignals()
+
+    def run(self):
+        """Enumerate devices and emit the result back to the UI thread."""
+        try:
+            device_list = self.device_list
+            ret = IMV.MvCamera.IMV_EnumDevices(device_list, self.interface_type)
+            if ret == IMV.IMV_OK:
+                _DeviceCache.store(self.interface_type, device_list)
+            self.signals.finished.emit(device_list, ret)
+        except Exception as e:
+            logging.getLogger(__name__).exception("Exception during device enumeration")
+            self.signals.failed.emit(str(e))
+
+
+class _SaveSignals(QObject):
+    """
+    Signals emitted by _SaveImageTask.
+
+    Signals:
+        finished: Emits (filename, success) when the image has been written
+    """
+
+    finished = Signal(str, bool)
+
+
+class _SaveImageTask(QRunnable):
+    """
+    Background task encoding and writing a captured image as JPEG.
+
+    Works on a QImage (QPixmap must not be used outside the GUI thread) or
+    an OpenCV image copied from an SDK frame.
+    """
+
+    def __init__(self, image, filename, quality=90):
+        """
+        Args:
+            image: QImage, or OpenCV image (numpy array) to save
+            filename: Target file path
+            quality: JPEG quality (0-100)
+        """
+        super().__init__()
+        self.image = image
+        self.filename = filename
+        self.quality = quality
+        self.signals = _SaveSignals()
+
+    def run(self):
+        """Save the image and report the result back to the UI thread."""
+        try:
+            if isinstance(self.image, QImage):
+                ok = self.image.save(self.filename, "JPEG", self.quality)
+            else:
+                from camera_worker import save_jpeg
+                ok = save_jpeg(self.image, self.filename, self.quality)
+        except Exception:
+            logging.getLogger(__name__).exception("Exception while saving captured image")
+            ok = False
+        self.signals.finished.emit(self.filename, ok)
+
+
+# Soft-trigger single capture progress (see CameraControlApp.single_capture)
+_CAPTURE_IDLE = 0      # Nothing to undo besides the device handle
+_CAPTURE_GRABBING = 1  # IMV_StartGrabbing succeeded
+_CAPTURE_FRAME = 2     # A frame is held and must be released
+
+
+class _CameraLifecycle(QObject):
+    """
+    Camera connect/disconnect sequence, run on a dedicated QThread.
+
+    The blocking SDK calls (IMV_CreateHandle, IMV_Open, IMV_Close, ...) and
+    the wait for the worker thread happen here, so the UI thread only sends
+    requests and reflects the completion signals.
+    """
+
+    status = Signal(int, str)  # (logging level, message)
+    connected = Signal(bool, str)
+    disconnected = Signal(bool, str)
+
+    def __init__(self):
+        super().__init__()
+        self.logger = logging.getLogger(__name__)
+        self.connect_callback = None  # Kept alive while subscribed
+
+    @Slot(object, int)
+    def do_connect(self, camera, index):
+        """
+        Create the device handle, open the camera and configure streaming.
+
+        Args:
+            camera: MvCamera instance
+            index: Device index in the enumerated device list
+        """
+        try:
+            # A handle kept open by single capture is released first
+            if camera.IMV_IsOpen():
+                camera.IMV_Close()
+                camera.IMV_DestroyHandle()
+
+            # Step 1: Create device handle
+            self.status.emit(logging.INFO, "Step 1/3: Creating device handle...")
+            self.logger.info("Creating device handle")
+            ret = camera.IMV_CreateHandle(
+                IMV.IMV_ECreateHandleMode.modeByIndex,
+                byref(c_uint(index))
+            )
+
+            if ret != IMV.IMV_OK:
+                self.logger.error(f"IMV_CreateHandle failed: {ret}")
+                raise Exception(f"Failed to create device handle. Error code: {ret}")
+
+            self.status.emit(logging.INFO, "Device handle created successfully")
+
+            # Step 2: Open camera
+            self.status.emit(logging.INFO, "Step 2/3: Opening camera...")
+            ret = camera.IMV_Open()
+
+            if ret != IMV.IMV_OK:
+                camera.IMV_DestroyHandle()
+                raise Exception(f"Failed to open camera. Error code: {ret}")
+
+            self.status.emit(logging.INFO, "Camera opened successfully")
+            self.logger.info("Camera opened successfully")
+
+            # Invalidate the device cache on online/offline events (e.g. cable unplugged)
+            self._subscribe_connection_events(camera)
+
+            # Ensure acquisition mode is Off for continuous streaming
+            self.status.emit(logging.INFO, "Configuring camera for continuous streaming...")
+            ret = camera.IMV_SetEnumFeatureSymbol("AcquisitionMode", "Continuous")
+            if ret != IMV.IMV_OK:
+                self.status.emit(logging.WARNING, f"WARNING: Failed to set AcquisitionMode to Continuous. Error code: {ret}")
+                self.logger.warning(f"Failed to set AcquisitionMode to Off: {ret}")
+            else:
+                self.status.emit(logging.INFO, "AcquisitionMode set to Continuous")
+
+            self.connected.emit(True, "")
+
+        except Exception as e:
+            self.logger.exception("Connection failed")
+
+            # Cleanup on failure
+            try:
+                if camera.IMV_IsOpen():
+                    camera.IMV_Close()
+                camera.IMV_DestroyHandle()
+                self.logger.info("Cleanup after failed connection executed")
+            except Exception:
+                self.logger.exception("Cleanup after failed connection failed")
+            _DeviceCache.invalidate()  # Device set may have changed
+
+            self.connected.emit(False, str(e))
+
+    @Slot(object, object)
+    def do_disconnect(self, camera, worker):
+        """
+        Stop the worker thread, close the camera and destroy the device handle.
+
+        Args:
+            camera: MvCamera instance
+            worker: CameraWorker to stop, or None if streaming never started
+        """
+        try:
+            # Step 1: Stop worker thread
+            if worker is not None:
+                self.status.emit(logging.INFO, "Step 1/3: Stopping video stream...")
+                self.logger.info("Stopping worker thread")
+
+                worker.stop()
+                if not worker.wait(5000):  # Wait up to 5 seconds for thread to finish
+                    self.status.emit(logging.WARNING, "WARNING: Worker thread kept running after stop request")
+                    worker.terminate()
+                    if not worker.wait(1000):
+                        self.status.emit(logging.ERROR, "ERROR: Worker thread did not terminate, closing camera anyway")
+
+                self.status.emit(logging.INFO, "Video stream stopped")
+
+            # Step 2: Close camera
+            self.status.emit(logging.INFO, "Step 2/3: Closing camera...")
+            self.logger.info("Closing camera if open")
+            if camera.IMV_IsOpen():
+                ret = camera.IMV_Close()
+                if ret != IMV.IMV_OK:
+                    self.status.emit(logging.WARNING, f"WARNING: Camera close returned error code: {ret}")
+                    self.logger.warning(f"Camera close returned error code: {ret}")
+                else:
+                    self.status.emit(logging.INFO, "Camera closed successfully")
+                    self.logger.info("Camera closed successfully")
+
+            # Step 3: Destroy device handle
+            self.status.emit(logging.INFO, "Step 3/3: Destroying device handle...")
+            ret = camera.IMV_DestroyHandle()
+            if ret != IMV.IMV_OK:
+                self.status.emit(logging.WARNING, f"WARNING: Handle destruction returned error code: {ret}")
+                self.logger.warning(f"Handle destruction returned error code: {ret}")
+            else:
+                self.status.emit(logging.INFO, "Device handle destroyed successfully")
+                self.logger.info("Device handle destroyed successfully")
+
+            # Next Refresh must rescan, the device may have been unplugged meanwhile
+            _DeviceCache.invalidate()
+
+            self.disconnected.emit(True, "")
+
+        except Exception as e:
+            self.logger.exception("Disconnection error")
+            self.disconnected.emit(False, str(e))
+
+    def _subscribe_connection_events(self, camera):
+        """
+        Subscribe to the SDK connection event of the opened camera.
+
+        The SDK has no global hotplug notification, so device online/offline
+        events of the opened camera are used to invalidate the device cache.
+
+        Args:
+            camera: Opened MvCamera instance
+        """
+        if not hasattr(camera, "IMV_SubscribeConnectArg"):
+            return
+
+        ConnectCallbackType = CFUNCTYPE(None, c_void_p, c_void_p)
+        self.connect_callback = ConnectCallbackType(self._on_connection_event)
+        ret = camera.IMV_SubscribeConnectArg(self.connect_callback, None)
+        if ret != IMV.IMV_OK:
+            self.logger.warning(f"IMV_SubscribeConnectArg failed: {ret}")
+
+    def _on_connection_event(self, pConnectArg, pUser):
+        """
+        Connection event callback (called from SDK thread).
+
+        Args:
+            pConnectArg: Pointer to IMV_SConnectArg (not used)
+            pUser: User data (not used)
+        """
+        _DeviceCache.invalidate()
+        self.logger.info("Device connection state changed, device cache invalidated")
+
+
 class CameraControlApp(QMainWindow):
     """
     Main application window for industrial camera control.
@@ -57,45 +480,103 @@ class CameraControlApp(QMainWindow):
     - QR/Barcode recognition results display
     """
 
+    # Requests to the camera lifecycle thread
+    connect_requested = Signal(object, int)
+    disconnect_requested = Signal(object, object)
+
     def __init__(self):
         super().__init__()
-        # Logger
-        logging.basicConfig(
-            filename='camera_app.log',
-            filemode='w',
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            level=logging.WARNING
-        )
+        # Logger (file writes happen on the QueueListener thread)
+        self.log_listener = setup_logging('camera_app.log', logging.WARNING)
         self.logger = logging.getLogger(__name__)
         self.setWindowTitle("Industrial Camera Control - QR/Barcode Recognition")
         self.setWindowIcon(QIcon(resource_path("icon.ico")))
         self.setGeometry(100, 100, 1100, 700)
 
-        # Camera and worker thread references
-        self.camera = MvCamera()
+        # Camera and worker thread references (camera is created on first use)
+        self.camera = None
         self.worker = None
-        self.device_list = None
+        self.device_list = None  # Single IMV_DeviceList, enumerated in place on every refresh
+        self.device_serials = []  # Serial number of each device_combo entry
+        self._device_combo_timestamp = None  # _DeviceCache.timestamp of the enumeration shown
+        self._capture_serial = None  # Device kept open by soft-trigger single capture
         self.selected_device_index = -1
 
-        # Frame processing flag to prevent queue buildup
-        self.is_processing_frame = False
-
-        # Detection results for annotation overlay
-        self.current_detections = []
+        # Connect/disconnect SDK calls run on their own thread; the UI only
+        # reflects the completion signals
+        self._connection_busy = False
+        self._close_after_disconnect = False
+        self._lifecycle_thread = QThread(self)
+        self._lifecycle = _CameraLifecycle()
+        self._lifecycle.moveToThread(self._lifecycle_thread)
+        self.connect_requested.connect(self._lifecycle.do_connect)
+        self.disconnect_requested.connect(self._lifecycle.do_disconnect)
+        self._lifecycle.status.connect(self.log_message)
+        self._lifecycle.connected.connect(self._on_camera_connected)
+        self._lifecycle.disconnected.connect(self._on_camera_disconnected)
+        self._lifecycle_thread.start()
+
+        # Background device enumeration state
+        self._enum_in_flight = False
+        self._enum_task = None
+
+        # Pending background JPEG saves (keeps their signal hosts alive). Saves
+        # run in order on one dedicated thread, so a burst of captures neither
+        # writes files in parallel nor waits behind device enumeration
+        self._save_tasks = set()
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self.max_pending_saves = 16  # Each pending save holds a full frame
+
+        # Single capture file names: capture_<date>_<sequence>.jpg, the date
+        # prefix and sequence are set up once per day in _next_capture_path
+        self._save_dir = "captured_images"
+        self._capture_date = None
+        self._capture_prefix = None
+        self._capture_counter = None
+
+        # Preview refresh timer: pulls the latest worker frame once per display
+        # refresh (started on connect, stopped on disconnect/pause)
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._refresh_timer.timeout.connect(self.update_video_display)
 
         # fps 
         self.current_fps = 0.0
+        self._fps_tenths = None  # FPS shown in fps_label, in tenths
+
+        # Preview scaling: target size is cached from video_label resize events,
+        # smooth scaling is only used while the stream is not live
+        self._video_target_size = None
+        self._smooth_preview = True
+
+        # Still picture (single capture) shown while not streaming; it is
+        # rescaled with smooth scaling once resizing has settled
+        self._still_picture = None
+        self._resize_idle_timer = QTimer(self)
+        self._resize_idle_timer.setSingleShot(True)
+        self._resize_idle_timer.setInterval(250)
+        self._resize_idle_timer.timeout.connect(self._rescale_still_picture)
 
         # Temperature monitoring
         self.temperature_warning_threshold = 65.0  # Warning at 60°C
         self.temperature_critical_threshold = 70.0  # Critical at 70°C
         self.temperature_warned = False  # Flag to prevent repeated warnings
+        self._last_temperature = None  # Last displayed reading
+
+        # Batched results log: lines are queued and flushed at 10 Hz
+        self._log_queue = collections.deque(maxlen=5000)  # Oldest lines drop if the UI stalls
+        self._ui_log_level = logging.INFO  # Status messages below this level are not shown
+        self.log_max_blocks = 2000  # Rolling window of the results text area
+        self._log_timer = QTimer(self)
+        self._log_timer.timeout.connect(self._flush_log_queue)
+        self._log_timer.start(100)
 
         # Initialize UI
         self.init_ui()
 
-        # Auto-discover devices on startup
-        self.discover_devices()
+        # Auto-discover devices once the event loop runs (window shows first)
+        QTimer.singleShot(0, self.discover_devices)
 
     def init_ui(self):
         """
@@ -123,7 +604,8 @@ class CameraControlApp(QMainWindow):
 
         # Refresh button
         self.refresh_btn = QPushButton("Refresh Devices")
-        self.refresh_btn.clicked.connect(self.discover_devices)
+        self.refresh_btn.setToolTip("Shift-click to force a rescan (bypass device cache)")
+        self.refresh_btn.clicked.connect(self.on_refresh_clicked)
         device_layout.addWidget(self.refresh_btn)
 
         # Connect/Disconnect button
@@ -156,19 +638,23 @@ class CameraControlApp(QMainWindow):
         self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.video_label.setMinimumSize(700, 600)
         self.video_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.video_label.setStyleSheet("QLabel { background-color: #2b2b2b; color: white; }")
+        self.video_label.setObjectName("videoLabel")  # Styled by APP_STYLESHEET
+        self.video_label.installEventFilter(self)  # Track size changes for preview scaling
         video_layout.addWidget(self.video_label)
+        self._video_target_size = self.video_label.size()
 
-        # # FPS display label (Deprecated)
-        # self.fps_label = QLabel("FPS: --")
-        # self.fps_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        # self.fps_label.setStyleSheet("QLabel { color: #00ff00; font-weight: bold; padding: 5px; }")
-        # video_layout.addWidget(self.fps_label)
+        # FPS display label, floating over the top-left corner of the video
+        # (a label update instead of text painted into every frame)
+        self.fps_label = QLabel("FPS: --", self.video_label)
+        self.fps_label.setObjectName("fpsLabel")  # Styled by APP_STYLESHEET
+        self.fps_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.fps_label.move(20, 20)
+        self.fps_label.hide()  # Shown while streaming
 
         # Temperature display label
         self.temperature_label = QLabel("Mainboard Temp.: --")
         self.temperature_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self.temperature_label.setStyleSheet("QLabel { color: green; font-weight :bold; padding: 5px}")
+        self.temperature_label.setObjectName("temperatureLabel")  # Styled by APP_STYLESHEET
         video_layout.addWidget(self.temperature_label)
         
         video_group.setLayout(video_layout)
@@ -179,11 +665,13 @@ class CameraControlApp(QMainWindow):
         results_layout = QVBoxLayout()
 
         # Results text area
-        self.results_text = QTextEdit()
+        self.results_text = QPlainTextEdit()  # Plain text: cheaper layout, no rich text parsing
         self.results_text.setReadOnly(True)
+        self.results_text.setUndoRedoEnabled(False)
         self.results_text.setPlaceholderText("QR/Barcode recognition results will appear here...")
         self.results_text.setMinimumHeight(100)
         self.results_text.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.results_text.setMaximumBlockCount(self.log_max_blocks)  # Qt drops the oldest blocks
         results_layout.addWidget(self.results_text)
 
         results_group.setLayout(results_layout)
@@ -196,76 +684,281 @@ class CameraControlApp(QMainWindow):
         # Status bar
         self.statusBar().showMessage("Ready - Please select a device")
 
-    def discover_devices(self):
+        # Worker error dialog, built once and reused by handle_worker_error
+        self._worker_error_box = QMessageBox(self)
+        self._worker_error_box.setIcon(QMessageBox.Icon.Critical)
+        self._worker_error_box.setWindowTitle("Worker Error")
+
+        # UI log level filter beside the status bar
+        self.log_level_combo = QComboBox()
+        for name, level in (("Debug", logging.DEBUG), ("Info", logging.INFO),
+                            ("Warning", logging.WARNING), ("Error", logging.ERROR)):
+            self.log_level_combo.addItem(name, level)
+        self.log_level_combo.setCurrentIndex(self.log_level_combo.findData(self._ui_log_level))
+        self.log_level_combo.setToolTip("Minimum level of messages shown in the results log")
+        self.log_level_combo.currentIndexChanged.connect(self.on_log_level_changed)
+        self.statusBar().addPermanentWidget(QLabel("Log level:"))
+        self.statusBar().addPermanentWidget(self.log_level_combo)
+
+    def ensure_camera(self):
+        """
+        Create the MvCamera instance on first use.
+
+        Returns:
+            MvCamera: The camera object
+        """
+        if self.camera is None:
+            self.camera = load_sdk().MvCamera()
+        return self.camera
+
+    def eventFilter(self, watched, event):
+        """
+        Cache the video label size on resize instead of querying it per frame.
+        """
+        if watched is self.video_label and event.type() == QEvent.Type.Resize:
+            self._video_target_size = event.size()
+            if self.worker is not None:
+                self.worker.set_display_size(self._video_target_size)
+            self._resize_idle_timer.start()  # Restarted on every resize step
+        return super().eventFilter(watched, event)
+
+    def show_still_picture(self, picture):
+        """
+        Show a still picture (e.g. a single capture) in the video label.
+
+        Args:
+            picture: Full resolution QPixmap, or OpenCV image (BGR or grayscale
+                     numpy array) as produced by a soft-trigger capture
+        """
+        self._still_picture = picture
+        self.video_label.setPixmap(self._scaled_still_picture(self.preview_transformation()))
+
+    def _scaled_still_picture(self, transformation):
+        """
+        Scale the still picture to the video label size.
+
+        OpenCV images are first reduced by an integer stride and scaled in their
+        own 1 or 3 bytes per pixel format, so only a label sized image is
+        converted to a 32-bit QPixmap.
+
+        Args:
+            transformation: Qt.TransformationMode for the final scaling
+
+        Returns:
+            QPixmap: The scaled picture
+        """
+        picture = self._still_picture
+        if isinstance(picture, QPixmap):
+            return picture.scaled(
+                self._video_target_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                transformation
+            )
+
+        from camera_worker import downsample_for_preview, image_to_qimage
+        reduced = downsample_for_preview(
+            picture, self._video_target_size.width(), self._video_target_size.height()
+        )
+        return QPixmap.fromImage(image_to_qimage(reduced).scaled(
+            self._video_target_size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            transformation
+        ))
+
+    def _rescale_still_picture(self):
+        """
+        Rescale the still picture to the new label size once resizing settled.
+
+        Live frames are already scaled to the new size by the worker.
+        """
+        if self._still_picture is None or self._refresh_timer.isActive():
+            return
+        self.video_label.setPixmap(self._scaled_still_picture(Qt.TransformationMode.SmoothTransformation))
+
+    def preview_transformation(self):
+        """
+        Get the scaling mode for the preview.
+
+        Returns:
+            Qt.TransformationMode: FastTransformation while streaming,
+            SmoothTransformation for paused/snapshot display
+        """
+        if self._smooth_preview:
+            return Qt.TransformationMode.SmoothTransformation
+        return Qt.TransformationMode.FastTransformation
+
+    def on_refresh_clicked(self):
+        """
+        Handle Refresh button click.
+
+        Shift-click bypasses the device cache and forces a full rescan.
+        """
+        force = bool(QApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier)
+        self.discover_devices(force=force)
+
+    def discover_devices(self, force=False):
         """
         Discover and list all available camera devices.
 
         This function:
-        1. Calls IMV_EnumDevices to find all connected cameras
-        2. Populates the device dropdown with device information
-        3. Enables the connect button if devices are found
-        4. Logs discovery status and errors
+        1. Reuses the cached device list if it is still fresh
+        2. Otherwise submits IMV_EnumDevices to the global thread pool,
+           so the UI stays responsive during the bus scan
+        3. Populates the device dropdown when enumeration finishes
+           (see _on_enum_finished)
+
+        Args:
+            force: If True, bypass the device cache and rescan
         """
-        self.log_message("Discovering devices...")
-        self.logger.info("Discovering devices...")
+        self.log_message(logging.INFO, "Discovering devices...", to_file=True)
 
         try:
-            # Create device list structure
-            self.device_list = IMV_DeviceList()
-            interface_type = IMV_EInterfaceType.interfaceTypeAll  # Search all interface types, Ignore Error
+            load_sdk()
+            interface_type = IMV.IMV_EInterfaceType.interfaceTypeAll  # Search all interface types, Ignore Error
 
-            # Enumerate devices
-            ret = MvCamera.IMV_EnumDevices(self.device_list, interface_type)
+            # Guard against overlapping enumerations (the list is filled in place)
+            if self._enum_in_flight:
+                self.logger.info("Device enumeration already in progress")
+                return
 
-            if ret != IMV_OK:
-                self.log_message(f"ERROR: Failed to enumerate devices. Error code: {ret}")
-                QMessageBox.critical(self, "Error", f"Failed to discover devices.\nError code: {ret}")
+            cached_list = None if force else _DeviceCache.get(interface_type)
+            if cached_list is not None:
+                self.device_list = cached_list
+                self.log_message(logging.INFO, "Using cached device list (Shift-click Refresh to force rescan)")
+                self.logger.info("Device discovery served from cache")
+                if self._device_combo_timestamp != _DeviceCache.timestamp:
+                    self.populate_device_combo()
                 return
 
-            # Clear existing items
-            self.device_combo.clear()
+            if self.device_list is None:
+                self.device_list = IMV.IMV_DeviceList()
+
+            self._enum_in_flight = True
+            self.refresh_btn.setEnabled(False)
+            self.statusBar().showMessage("Discovering devices...")
+
+            # Enumerate devices in background thread
+            task = _EnumTask(interface_type, self.device_list)
+            task.signals.finished.connect(self._on_enum_finished)
+            task.signals.failed.connect(self._on_enum_failed)
+            self._enum_task = task  # Keep signal host alive until finished
+            QThreadPool.globalInstance().start(task)
+
+        except Exception as e:
+            self._enum_in_flight = False
+            self.refresh_btn.setEnabled(self.worker is None)
+            self.log_message(logging.ERROR, f"ERROR: Exception during device discovery: {str(e)}")
+            self.logger.exception("Exception during device discovery")
+            QMessageBox.critical(self, "Error", f"Exception occurred:\n{str(e)}")
+
+    @Slot(object, int)
+    def _on_enum_finished(self, device_list, ret):
+        """
+        Handle completion of background device enumeration.
+
+        Args:
+            device_list: IMV_DeviceList filled by IMV_EnumDevices (self.device_list)
+            ret: Return code of IMV_EnumDevices
+        """
+        self._enum_in_flight = False
+        self._enum_task = None
+        self.refresh_btn.setEnabled(self.worker is None)
+
+        if ret != IMV.IMV_OK:
+            self.log_message(logging.ERROR, f"ERROR: Failed to enumerate devices. Error code: {ret}")
+            self.statusBar().showMessage("Device discovery failed")
+            QMessageBox.critical(self, "Error", f"Failed to discover devices.\nError code: {ret}")
+            return
+
+        self.device_list = device_list
+        self.populate_device_combo()
+
+    @Slot(str)
+    def _on_enum_failed(self, error_message):
+        """
+        Handle an exception raised during background device enumeration.
+
+        Args:
+            error_message: Error description
+        """
+        self._enum_in_flight = False
+        self._enum_task = None
+        self.refresh_btn.setEnabled(self.worker is None)
+        self.log_message(logging.ERROR, f"ERROR: Exception during device discovery: {error_message}")
+        self.statusBar().showMessage("Device discovery failed")
+        QMessageBox.critical(self, "Error", f"Exception occurred:\n{error_message}")
+
+    def populate_device_combo(self):
+        """
+        Populate the device dropdown from self.device_list.
+
+        The previously selected device is re-selected by serial number, so
+        the selection survives a Refresh even if the device order changed.
+        """
+        try:
+            # Remember the selected device before the combo is rebuilt
+            current_index = self.device_combo.currentIndex()
+            selected_serial = None
+            if 0 <= current_index < len(self.device_serials):
+                selected_serial = self.device_serials[current_index]
+
+            self.device_serials = []
 
             # Check if any devices found
             if self.device_list.nDevNum == 0:
-                self.log_message("No devices found. Please check camera connection.")
+                self.log_message(logging.INFO, "No devices found. Please check camera connection.")
                 self.logger.info("No devices found during discovery")
-                self.device_combo.addItem("No devices found")
+                self._set_device_combo_items(["No devices found"])
+                self._device_combo_timestamp = _DeviceCache.timestamp
                 self.connect_btn.setEnabled(False)
+                self.statusBar().showMessage("Ready - No devices found")
                 return
 
             # Populate device list
-            self.log_message(f"Found {self.device_list.nDevNum} device(s)")
-            self.logger.info(f"Found {self.device_list.nDevNum} device(s)")
+            self.log_message(logging.INFO, f"Found {self.device_list.nDevNum} device(s)", to_file=True)
 
+            labels = []
+            dev_info = self.device_list.pDevInfo
             for i in range(self.device_list.nDevNum):
-                device_info = self.device_list.pDevInfo[i]
-
-                # Extract device information
-                device_name = f"Device {i}: "
-
-                # Try to get manufacturer and model info
-                try:
-                    manufacturer = device_info.vendorName.decode('utf-8') if device_info.vendorName else "Unknown"
-                    model = device_info.modelName.decode('utf-8') if device_info.modelName else "Unknown"
-                    serial = device_info.serialNumber.decode('utf-8') if device_info.serialNumber else "Unknown"
-                    ip_address = device_info.DeviceSpecificInfo.gigeDeviceInfo.ipAddress.decode('utf-8') if device_info.DeviceSpecificInfo.gigeDeviceInfo.ipAddress else "N/A"
-                    device_name += f"{manufacturer} {model} (S/N: {serial}) IP: {ip_address}"
-                except:
-                    device_name += "Camera Device"
-
-                self.device_combo.addItem(device_name)
+                device_info = dev_info[i]
+                # Reuse the decoded label for a known device, decode only new ones
+                label = _DeviceCache.get_label(device_info)
+                labels.append(f"Device {i}: {label}")
+                self.device_serials.append(device_info.serialNumber)
+
+            # Restore the previous selection
+            selected_index = 0
+            if selected_serial in self.device_serials:
+                selected_index = self.device_serials.index(selected_serial)
+            self._set_device_combo_items(labels, selected_index)
+            self._device_combo_timestamp = _DeviceCache.timestamp
 
             # Enable connect button
             self.connect_btn.setEnabled(True)
-            self.log_message("Device discovery completed successfully")
-            self.logger.info("Device discovery completed successfully")
+            self.log_message(logging.INFO, "Device discovery completed successfully", to_file=True)
             self.statusBar().showMessage(f"Found {self.device_list.nDevNum} device(s) - Ready to connect")
 
         except Exception as e:
-            self.log_message(f"ERROR: Exception during device discovery: {str(e)}")
+            self.log_message(logging.ERROR, f"ERROR: Exception during device discovery: {str(e)}")
             self.logger.exception("Exception during device discovery")
             QMessageBox.critical(self, "Error", f"Exception occurred:\n{str(e)}")
 
+    def _set_device_combo_items(self, labels, current_index=0):
+        """
+        Replace the device dropdown items in one batch.
+
+        Signals are blocked during the rebuild, so it emits no per-item
+        change signals.
+
+        Args:
+            labels: Item texts
+            current_index: Index to select after the rebuild
+        """
+        with QSignalBlocker(self.device_combo):
+            self.device_combo.clear()
+            self.device_combo.addItems(labels)
+            self.device_combo.setCurrentIndex(current_index)
+
     def toggle_connection(self):
         """
         Toggle camera connection state.
@@ -273,22 +966,37 @@ class CameraControlApp(QMainWindow):
         When disconnected: Initiates connection sequence
         When connected: Initiates disconnection sequence
         """
+        if self._connection_busy:
+            return
         if self.worker is None:
             self.connect_camera()
-            self.param_btn.setEnabled(True)
         else:
             self.disconnect_camera()
+
+    def _set_connection_busy(self, busy):
+        """
+        Lock the connection controls while a connect/disconnect is in progress.
+
+        Args:
+            busy: True while the lifecycle thread is working
+        """
+        self._connection_busy = busy
+        self.connect_btn.setEnabled(not busy)
+        self.single_btn.setEnabled(not busy)  # Soft-trigger capture would use the same camera handle
+        if busy:
+            self.device_combo.setEnabled(False)
+            self.refresh_btn.setEnabled(False)
             self.param_btn.setEnabled(False)
 
     def connect_camera(self):
         """
         Connect to the selected camera device.
 
-        Connection sequence:
+        Connection sequence (on the lifecycle thread):
         1. Get selected device from dropdown
         2. Create device handle (IMV_CreateHandle)
         3. Open camera (IMV_Open)
-        4. Start worker thread for streaming
+        4. Start worker thread for streaming (on completion, see _on_camera_connected)
         """
         # Get selected device index
         self.selected_device_index = self.device_combo.currentIndex()
@@ -297,197 +1005,181 @@ class CameraControlApp(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select a valid device")
             return
 
-        self.log_message(f"Connecting to device {self.selected_device_index}...")
+        self.log_message(logging.INFO, f"Connecting to device {self.selected_device_index}...")
         self.statusBar().showMessage("Connecting to camera...")
         self.logger.info(f"Connecting to device index: {self.selected_device_index}")
 
-        try:
-            # Step 1: Create device handle
-            self.log_message("Step 1/3: Creating device handle...")
-            self.logger.info("Creating device handle")
-            device_info = self.device_list.pDevInfo[self.selected_device_index]
-            ret = self.camera.IMV_CreateHandle(
-                IMV_ECreateHandleMode.modeByIndex,
-                byref(c_uint(self.selected_device_index))
-            )
-
-            if ret != IMV_OK:
-                self.logger.error(f"IMV_CreateHandle failed: {ret}")
-                raise Exception(f"Failed to create device handle. Error code: {ret}")
-
-            self.log_message("Device handle created successfully")
+        self._set_connection_busy(True)
+        self._capture_serial = None  # do_connect releases the capture handle
+        self.connect_requested.emit(self.ensure_camera(), self.selected_device_index)
 
-            # Step 2: Open camera
-            self.log_message("Step 2/3: Opening camera...")
-            ret = self.camera.IMV_Open()
-
-            if ret != IMV_OK:
-                self.camera.IMV_DestroyHandle()
-                raise Exception(f"Failed to open camera. Error code: {ret}")
-
-            self.log_message("Camera opened successfully")
-            self.logger.info("Camera opened successfully")
+    @Slot(bool, str)
+    def _on_camera_connected(self, ok, error):
+        """
+        Start streaming once the camera is open, or report the failure.
 
-            # Ensure acquisition mode is Off for continuous streaming
-            self.log_message("Configuring camera for continuous streaming...")
-            ret = self.camera.IMV_SetEnumFeatureSymbol("AcquisitionMode", "Continuous")
-            if ret != IMV_OK:
-                self.log_message(f"WARNING: Failed to set AcquisitionMode to Continuous. Error code: {ret}")
-                self.logger.warning(f"Failed to set AcquisitionMode to Off: {ret}")
-            else:
-                self.log_message("AcquisitionMode set to Continuous")
+        Args:
+            ok: True if the camera was opened
+            error: Error description if ok is False
+        """
+        if not ok:
+            self._set_connection_busy(False)
+            self.log_message(logging.ERROR, f"ERROR: Connection failed - {error}")
+            QMessageBox.critical(self, "Connection Error", f"Failed to connect to camera:\n{error}")
+            self.statusBar().showMessage("Connection failed")
+            self.device_combo.setEnabled(True)
+            self.refresh_btn.setEnabled(True)
+            if self._close_after_disconnect:
+                self.close()
+            return
 
+        try:
             # Step 3: Start worker thread for streaming
-            self.log_message("Step 3/3: Starting video stream...")
-            self.logger.info("Starting worker thread for streaming")
+            self.log_message(logging.INFO, "Step 3/3: Starting video stream...", to_file=True)
+            from camera_worker import CameraWorker
             self.worker = CameraWorker(self.camera)
 
             # Connect worker signals to UI slots
-            self.worker.image_signal.connect(self.update_video_display)
+            self.worker.set_display_size(self._video_target_size)
             self.worker.result_signal.connect(self.update_recognition_results)
             self.worker.error_signal.connect(self.handle_worker_error)
             self.worker.status_signal.connect(self.log_message)
             self.worker.fps_signal.connect(self.update_fps_display)
-            self.worker.detection_signal.connect(self.update_detections)  # New: detection results
             self.worker.temperature_signal.connect(self.update_temperature_display)  # New: temperature monitoring
 
             # Start the worker thread
             self.worker.start()
-
-            # Update UI state
-            self.connect_btn.setText("Disconnect")
-            self.device_combo.setEnabled(False)
-            self.refresh_btn.setEnabled(False)
-
-            self.log_message("Camera connected and streaming started successfully!")
-            self.logger.info("Camera connected and streaming started successfully")
-            self.statusBar().showMessage("Camera connected - Streaming active")
+            self.start_preview_refresh()
 
         except Exception as e:
-            self.log_message(f"ERROR: Connection failed - {str(e)}")
+            self.log_message(logging.ERROR, f"ERROR: Connection failed - {str(e)}")
             self.logger.exception("Connection failed")
             QMessageBox.critical(self, "Connection Error", f"Failed to connect to camera:\n{str(e)}")
             self.statusBar().showMessage("Connection failed")
 
-            # Cleanup on failure
-            if self.camera.IMV_IsOpen():
-                self.camera.IMV_Close()
-            self.camera.IMV_DestroyHandle()
-            self.logger.info("Cleanup after failed connection executed")
+            # Close the camera again; the UI is restored in _on_camera_disconnected
+            self.worker = None
+            self.disconnect_requested.emit(self.camera, None)
+            return
+
+        # Update UI state
+        self._set_connection_busy(False)
+        self.connect_btn.setText("Disconnect")
+        self.param_btn.setEnabled(True)
+
+        self.log_message(logging.INFO, "Camera connected and streaming started successfully!", to_file=True)
+        self.statusBar().showMessage("Camera connected - Streaming active")
+
+        # Window was closed while connecting
+        if self._close_after_disconnect:
+            self.disconnect_camera()
 
     def disconnect_camera(self):
         """
         Disconnect from the camera device.
 
-        Disconnection sequence:
+        Disconnection sequence (on the lifecycle thread):
         1. Stop worker thread (stops frame grabbing)
         2. Close camera (IMV_Close)
         3. Destroy device handle (IMV_DestroyHandle)
 
         TODO: Implement force disconnect option
         """
-        self.log_message("Disconnecting camera...")
+        self.log_message(logging.INFO, "Disconnecting camera...", to_file=True)
         self.statusBar().showMessage("Disconnecting...")
-        self.logger.info("Disconnect initiated by user")
 
-        try:
-            # Step 1: Stop worker thread
-            if self.worker is not None:
-                self.log_message("Step 1/3: Stopping video stream...")
-                self.logger.info("Stopping worker thread")
-
-                # Disconnect signals first to prevent queued signals from updating UI
-                self.worker.image_signal.disconnect()
-                self.worker.result_signal.disconnect()
-                self.worker.error_signal.disconnect()
-                self.worker.status_signal.disconnect()
-
-                self.worker.stop()
-                self.worker.wait(5000)  # Wait up to 5 seconds for thread to finish
-
-                if self.worker.isRunning():
-                    self.log_message("WARNING: Worker thread kept running after stop request")
-                    self.worker.terminate()
-                    self.worker.wait()
+        self._set_connection_busy(True)
 
-                self.worker = None
-                self.log_message("Video stream stopped")
+        worker = self.worker
+        self.worker = None
+        if worker is not None:
+            # Stop the preview and disconnect all worker signals from this window
+            # first, so nothing (FPS, temperature, ...) updates the UI afterwards
+            self.stop_preview_refresh()
+            try:
+                worker.disconnect(self)
+            except (RuntimeError, TypeError):
+                pass
 
-            # Step 2: Close camera
-            self.log_message("Step 2/3: Closing camera...")
-            self.logger.info("Closing camera if open")
-            if self.camera.IMV_IsOpen():
-                ret = self.camera.IMV_Close()
-                if ret != IMV_OK:
-                    self.log_message(f"WARNING: Camera close returned error code: {ret}")
-                    self.logger.warning(f"Camera close returned error code: {ret}")
-                else:
-                    self.log_message("Camera closed successfully")
-                    self.logger.info("Camera closed successfully")
+        self.disconnect_requested.emit(self.camera, worker)
 
-            # Step 3: Destroy device handle
-            self.log_message("Step 3/3: Destroying device handle...")
-            ret = self.camera.IMV_DestroyHandle()
-            if ret != IMV_OK:
-                self.log_message(f"WARNING: Handle destruction returned error code: {ret}")
-                self.logger.warning(f"Handle destruction returned error code: {ret}")
-            else:
-                self.log_message("Device handle destroyed successfully")
-                self.logger.info("Device handle destroyed successfully")
+    @Slot(bool, str)
+    def _on_camera_disconnected(self, ok, error):
+        """
+        Reset the UI once the camera is closed.
 
-            # Update UI state
-            self.connect_btn.setText("Connect")
-            self.device_combo.setEnabled(True)
-            self.refresh_btn.setEnabled(True)
-            self.current_detections = []  # Clear detection results
-            self.video_label.clear()
-            self.video_label.setText("No camera connected")
-            self.temperature_label.setText("Mainboard Temp.: --")
-            self.temperature_label.setStyleSheet("QLabel { color: red; font-weight: bold; padding: 5px; }")
-            self.temperature_warned = False  # Reset temperature warning flag
-            self.param_window = None  # Close parameter window if open
-
-            self.log_message("Camera disconnected successfully")
+        Args:
+            ok: True if the disconnection sequence completed
+            error: Error description if ok is False
+        """
+        self._set_connection_busy(False)
+
+        # Update UI state
+        self.connect_btn.setText("Connect")
+        self.device_combo.setEnabled(True)
+        self.refresh_btn.setEnabled(True)
+        self._still_picture = None
+        self.video_label.clear()
+        self.video_label.setText("No camera connected")
+        self.temperature_label.setText("Mainboard Temp.: --")
+        self.set_temperature_level("offline")
+        self.temperature_warned = False  # Reset temperature warning flag
+        self._last_temperature = None
+        self.param_window = None  # Close parameter window if open
+
+        # Cached ranges and editability may not hold for the next connection
+        from camera_config import CameraConfig
+        CameraConfig().clear_device_cache()
+
+        if ok:
+            self.log_message(logging.INFO, "Camera disconnected successfully")
             self.statusBar().showMessage("Disconnected - Ready to connect")
+        else:
+            self.log_message(logging.ERROR, f"ERROR: Disconnection error - {error}")
+            QMessageBox.warning(self, "Disconnection Error", f"Error during disconnection:\n{error}")
 
-        except Exception as e:
-            self.log_message(f"ERROR: Disconnection error - {str(e)}")
-            self.logger.exception("Disconnection error")
-            QMessageBox.warning(self, "Disconnection Error", f"Error during disconnection:\n{str(e)}")
+        if self._close_after_disconnect:
+            self.close()
 
-    @Slot(QImage)
-    def update_video_display(self, q_image):
+    def start_preview_refresh(self):
+        """
+        Start presenting worker frames, paced to the display refresh rate.
+        """
+        screen = self.screen() or QGuiApplication.primaryScreen()
+        refresh_rate = screen.refreshRate() if screen is not None else 0.0
+        if refresh_rate <= 0:
+            refresh_rate = 60.0
+        self._refresh_timer.setInterval(max(1, int(1000 / refresh_rate)))
+        self._refresh_timer.start()
+        self._smooth_preview = False  # Live preview uses fast scaling
+        self._still_picture = None  # Live frames replace the still picture
+        self.fps_label.show()
+
+    def stop_preview_refresh(self):
+        """
+        Stop presenting worker frames (stream paused or disconnected).
         """
-        Update the video display with a new frame.
+        self._refresh_timer.stop()
+        self._smooth_preview = True
+        self.fps_label.hide()
 
-        Uses frame dropping strategy to prevent queue buildup and reduce latency.
-        Overlays detection boxes if available.
+    @Slot()
+    def update_video_display(self):
+        """
+        Present the latest worker frame (driven by the refresh timer).
 
-        Args:
-            q_image: QImage object containing the processed frame
+        The worker keeps only the latest display frame, already converted,
+        scaled and annotated with detection boxes, so at most one setPixmap
+        happens per display refresh no matter how fast frames arrive.
         """
-        # Drop frame if still processing previous frame (prevents queue buildup)
-        if self.is_processing_frame:
+        if self.worker is None:
             return
 
-        self.is_processing_frame = True
+        q_image = self.worker.take_display_frame()
+        if q_image is None:
+            return
 
-        try:
-            if q_image is not None:
-                # Draw detections on image if available
-                if self.current_detections:
-                    q_image = self.draw_detections_on_qimage(q_image, self.current_detections)
-
-                # Scale image to fit display while maintaining aspect ratio
-                pixmap = QPixmap.fromImage(q_image)
-                scaled_pixmap = pixmap.scaled(
-                    self.video_label.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.FastTransformation
-                )
-                self.video_label.setPixmap(scaled_pixmap)
-        finally:
-            self.is_processing_frame = False
+        self.video_label.setPixmap(QPixmap.fromImage(q_image))
 
     @Slot(str)
     def update_recognition_results(self, result_text):
@@ -498,7 +1190,7 @@ class CameraControlApp(QMainWindow):
             result_text: Decoded QR/Barcode text
         """
         if result_text:
-            self.results_text.append(f"[DETECTED] {result_text}")
+            self._enqueue_log(f"[DETECTED] {result_text}")
             self.statusBar().showMessage(f"Code detected: {result_text[:50]}...")
 
     @Slot(float)
@@ -511,6 +1203,31 @@ class CameraControlApp(QMainWindow):
         """
         self.current_fps = fps
 
+        # Same value at the displayed precision: skip the text and relayout
+        tenths = round(fps * 10)
+        if tenths == self._fps_tenths:
+            return
+        self._fps_tenths = tenths
+
+        self.fps_label.setText("FPS: %.1f" % (tenths / 10))
+        self.fps_label.adjustSize()
+
+    def set_temperature_level(self, level):
+        """
+        Switch the temperature label style (see APP_STYLESHEET).
+
+        The label is only re-polished when the level actually changes.
+
+        Args:
+            level: "normal", "warning", "critical" or "offline"
+        """
+        if self.temperature_label.property("level") == level:
+            return
+        self.temperature_label.setProperty("level", level)
+        style = self.temperature_label.style()
+        style.unpolish(self.temperature_label)
+        style.polish(self.temperature_label)
+
     @Slot(float)
     def update_temperature_display(self, temperature):
         """
@@ -519,13 +1236,25 @@ class CameraControlApp(QMainWindow):
         Args:
             temperature: Device temperature in Celsius
         """
-        # Update temperature label
-        self.temperature_label.setText(f"Mainboard Temp.: {temperature:.1f}°C")
+        if temperature >= self.temperature_critical_threshold:
+            level = "critical"
+        elif temperature >= self.temperature_warning_threshold:
+            level = "warning"
+        else:
+            level = "normal"
+
+        # Readings within 0.1°C of the displayed one keep the text, unless
+        # they cross into another band
+        if (self._last_temperature is None
+                or abs(temperature - self._last_temperature) >= 0.1
+                or level != self.temperature_label.property("level")):
+            self._last_temperature = temperature
+            self.temperature_label.setText(f"Mainboard Temp.: {temperature:.1f}°C")
 
         # Check for temperature alerts
-        if temperature >= self.temperature_critical_threshold:
+        if level == "critical":
             # Critical temperature - red color and show alert
-            self.temperature_label.setStyleSheet("QLabel { color: red; font-weight: bold; padding: 5px; background-color: #ffcccc; }")
+            self.set_temperature_level("critical")
             if not self.temperature_warned:
                 self.temperature_warned = True
                 QMessageBox.critical(
@@ -535,10 +1264,10 @@ class CameraControlApp(QMainWindow):
                     f"Critical threshold: {self.temperature_critical_threshold}°C\n"
                     f"Please check device cooling and consider disconnecting the camera."
                 )
-                self.log_message(f"CRITICAL: Device temperature {temperature:.1f}°C exceeds critical threshold {self.temperature_critical_threshold}°C")
-        elif temperature >= self.temperature_warning_threshold:
+                self.log_message(logging.CRITICAL, f"CRITICAL: Device temperature {temperature:.1f}°C exceeds critical threshold {self.temperature_critical_threshold}°C")
+        elif level == "warning":
             # Warning temperature - orange color and show warning
-            self.temperature_label.setStyleSheet("QLabel { color: orange; font-weight: bold; padding: 5px; background-color: #fff4e6; }")
+            self.set_temperature_level("warning")
             if not self.temperature_warned:
                 self.temperature_warned = True
                 QMessageBox.warning(
@@ -548,108 +1277,87 @@ class CameraControlApp(QMainWindow):
                     f"Warning threshold: {self.temperature_warning_threshold}°C\n"
                     f"Please monitor the device temperature."
                 )
-                self.log_message(f"WARNING: Device temperature {temperature:.1f}°C exceeds warning threshold {self.temperature_warning_threshold}°C")
+                self.log_message(logging.WARNING, f"WARNING: Device temperature {temperature:.1f}°C exceeds warning threshold {self.temperature_warning_threshold}°C")
         else:
             # Normal temperature - green color
-            self.temperature_label.setStyleSheet("QLabel { color: green; font-weight: bold; padding: 5px; }")
+            self.set_temperature_level("normal")
             # Reset warning flag when temperature returns to normal
             if self.temperature_warned and temperature < self.temperature_warning_threshold - 5.0:
                 self.temperature_warned = False
-                self.log_message(f"INFO: Device temperature normalized to {temperature:.1f}°C")
+                self.log_message(logging.INFO, f"INFO: Device temperature normalized to {temperature:.1f}°C")
 
-    @Slot(list)
-    def update_detections(self, detections):
+    @Slot(str)
+    def handle_worker_error(self, error_message):
         """
-        Update detection results for overlay.
+        Handle errors from the worker thread.
 
         Args:
-            detections: List of detection dicts with 'type', 'text', 'points'
+            error_message: Error description
         """
-        self.current_detections = detections
+        self.log_message(logging.ERROR, f"WORKER ERROR: {error_message}")
 
-    def draw_detections_on_qimage(self, q_image, detections):
-        """
-        Draw detection boxes on QImage using QPainter.
+        # Reuse one dialog; errors arriving while it is open only update its text
+        self._worker_error_box.setText(error_message)
+        if not self._worker_error_box.isVisible():
+            self._worker_error_box.exec()
 
-        Args:
-            q_image: QImage to draw on
-            detections: List of detection dicts
+        # Attempt to disconnect on critical error
+        if self.worker is not None:
+            self.disconnect_camera()
 
-        Returns:
-            QImage with detections drawn
+    def log_message(self, level, message, to_file=False):
         """
-        if not detections:
-            return q_image
-
-        # Create a copy to draw on
-        result_image = q_image.copy()
-
-        # Create painter
-        painter = QPainter(result_image)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
-        # Draw detections and fps
-        pen = QPen()
-        pen.setWidth(12)
-
-        painter.setPen(QColor(0, 255, 9))
-        font = painter.font()
-        font.setPointSize(24)
-        font.setBold(True)
-        painter.setFont(font)
-
-        painter.drawText(20, 50, f"FPS: {self.current_fps:.1f}")
-        
-        for detection in detections:
-            det_type = detection.get('type', 'Unknown')
-            points = detection.get('points', None)
-
-            if points is None or len(points) == 0:
-                continue
-
-            # Draw polygon
-            qpoints = [QPoint(int(p[0]), int(p[1])) for p in points]
+        Log a message to the results text area.
 
-            # Choose color based on type
-            if det_type == 'QR':
-                pen.setColor(QColor(0, 255, 0))  # Green for QR codes
-                painter.setPen(pen)
+        Messages below the UI log level are dropped before reaching the
+        text area (the file logger is not affected).
 
-                # Draw QR code box
-                painter.drawPolygon(qpoints)
-            else:
-                pen.setColor(QColor(255, 0, 0))  # Red for barcodes
-                painter.setPen(pen)
+        Args:
+            level: logging level of the message (logging.INFO, logging.WARNING, ...)
+            message: Message to log
+            to_file: Also write the message to the application logger, instead
+                     of a separate self.logger call with the same text
+        """
+        if to_file:
+            self.logger.log(level, message)
+        if level < self._ui_log_level:
+            return
+        self._enqueue_log(f"[LOG] {message}")
 
-                # Draw barcode box
-                painter.drawPolygon(qpoints)
+    def on_log_level_changed(self, index):
+        """
+        Apply the log level selected in the status bar combo box.
 
-        painter.end()
-        return result_image
+        Args:
+            index: Selected combo box index
+        """
+        self._ui_log_level = self.log_level_combo.itemData(index)
 
-    @Slot(str)
-    def handle_worker_error(self, error_message):
+    def _enqueue_log(self, line):
         """
-        Handle errors from the worker thread.
+        Queue a line for the results text area.
+
+        Lines are flushed in batches by _flush_log_queue, so bursts of
+        messages cause a single document re-layout.
 
         Args:
-            error_message: Error description
+            line: Formatted line to append
         """
-        self.log_message(f"WORKER ERROR: {error_message}")
-        QMessageBox.critical(self, "Worker Error", error_message)
+        self._log_queue.append(line)
 
-        # Attempt to disconnect on critical error
-        if self.worker is not None:
-            self.disconnect_camera()
-
-    def log_message(self, message):
+    def _flush_log_queue(self):
         """
-        Log a message to the results text area.
+        Append all queued lines at once.
 
-        Args:
-            message: Message to log
+        The document keeps at most log_max_blocks blocks (see init_ui), so
+        memory and layout cost stay bounded.
         """
-        self.results_text.append(f"[LOG] {message}")
+        if not self._log_queue:
+            return
+
+        lines = "\n".join(self._log_queue)
+        self._log_queue.clear()
+        self.results_text.appendPlainText(lines)
 
     def closeEvent(self, event):
         """
@@ -666,13 +1374,35 @@ class CameraControlApp(QMainWindow):
             )
 
             if reply == QMessageBox.StandardButton.Yes:
+                # Close again once the lifecycle thread reports the camera closed
+                self._close_after_disconnect = True
                 self.disconnect_camera()
-                event.accept()
-            else:
-                event.ignore()
+            event.ignore()
+            return
+        elif self._connection_busy:
+            self._close_after_disconnect = True
+            self.statusBar().showMessage("Waiting for the camera to close...")
+            event.ignore()
+            return
         else:
             event.accept()
 
+        # Release a handle left open by single capture
+        if self._capture_serial is not None:
+            self._release_capture_handle()
+
+        # Let queued capture files finish writing
+        self._save_pool.waitForDone(5000)
+
+        # Stop the lifecycle thread (idle at this point)
+        self._lifecycle_thread.quit()
+        self._lifecycle_thread.wait()
+
+        # Flush and stop the background log writer
+        if self.log_listener is not None:
+            self.log_listener.stop()
+            self.log_listener = None
+
     def open_camera_parameter_window(self):
         """
         Open the camera parameter configuration window.
@@ -680,6 +1410,77 @@ class CameraControlApp(QMainWindow):
         self.param_window = CameraParameterWindow(self.worker, self.camera, self.logger, self)
         self.param_window.show()
 
+    def _release_capture_handle(self):
+        """
+        Close the device handle kept open by soft-trigger single capture.
+        """
+        self._capture_serial = None
+        if self.camera is None or not self.camera.IMV_IsOpen():
+            return
+        self.camera.IMV_Close()
+        self.camera.IMV_DestroyHandle()
+        self.log_message(logging.INFO, "Camera closed after single capture")
+
+    def _next_capture_path(self):
+        """
+        Get the file name and path for the next single capture.
+
+        The save directory, date prefix and sequence start are only set up on
+        the first capture of a day; the sequence continues after captures
+        already saved that day (e.g. by an earlier run).
+
+        Returns:
+            tuple: (filename, filepath)
+        """
+        today = datetime.date.today()
+        if today != self._capture_date:
+            os.makedirs(self._save_dir, exist_ok=True)
+            prefix = f"capture_{today.strftime('%Y%m%d')}_"
+            pattern = re.compile(re.escape(prefix) + r"(\d+)\.jpg$")
+            last = 0
+            for name in os.listdir(self._save_dir):
+                match = pattern.match(name)
+                if match:
+                    last = max(last, int(match.group(1)))
+            self._capture_date = today
+            self._capture_prefix = prefix
+            self._capture_counter = itertools.count(last + 1)
+
+        filename = f"{self._capture_prefix}{next(self._capture_counter):05d}.jpg"
+        return filename, os.path.join(self._save_dir, filename)
+
+    def _submit_save(self, image, filepath):
+        """
+        Queue a capture to be encoded and written on the save thread.
+
+        Args:
+            image: QImage or OpenCV image (numpy array)
+            filepath: Target file path
+        """
+        task = _SaveImageTask(image, filepath, 90)
+        task.signals.finished.connect(self._on_capture_saved)
+        self._save_tasks.add(task)
+        self._save_pool.start(task)
+
+    @Slot(str, bool)
+    def _on_capture_saved(self, filename, ok):
+        """
+        Report the result of a background capture save.
+
+        Args:
+            filename: Saved file path
+            ok: True if the image was written
+        """
+        self._save_tasks = {task for task in self._save_tasks if task.filename != filename}
+
+        if ok:
+            self.log_message(logging.INFO, f"SUCCESS: Image saved to {filename}")
+            QMessageBox.information(self, "Capture Success", f"Image saved to:\n{filename}")
+            self.logger.info(f"Single capture saved: {filename}")
+        else:
+            self.log_message(logging.ERROR, "ERROR: Failed to save image")
+            QMessageBox.warning(self, "Save Failed", "Failed to save the captured image.")
+
     def single_capture(self):
         """
         Execute single capture and save to file command.
@@ -688,34 +1489,36 @@ class CameraControlApp(QMainWindow):
         1. If worker is running (streaming): Save the latest frame from the video stream
         2. If worker is not running: Use soft trigger to capture a single frame
         """
+        # The lifecycle thread is opening or closing the camera
+        if self._connection_busy:
+            return
+
+        # Bound the save queue: each pending save holds a full frame in memory
+        if len(self._save_tasks) >= self.max_pending_saves:
+            self.log_message(logging.WARNING, "WARNING: Capture skipped, previous images are still being saved")
+            return
+
         try:
             if self.worker is not None:
                 # Mode 1: Worker is running, save latest frame from stream
-                self.log_message("Capturing frame from video stream...")
+                self.log_message(logging.INFO, "Capturing frame from video stream...")
 
                 # Get the latest QImage from the video display
                 pixmap = self.video_label.pixmap()
                 if pixmap is None or pixmap.isNull():
                     QMessageBox.warning(self, "Capture Failed", "No frame available to capture.")
-                    self.log_message("ERROR: No frame available in video stream")
+                    self.log_message(logging.ERROR, "ERROR: No frame available in video stream")
                     return
 
-                # Generate filename with timestamp
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"capture_{timestamp}.jpg"
+                # Generate filename with date and sequence number
+                filename, filepath = self._next_capture_path()
 
-                # Save the pixmap as JPEG
-                if pixmap.save(filename, "JPEG", 90):
-                    self.log_message(f"SUCCESS: Image saved to {filename}")
-                    QMessageBox.information(self, "Capture Success", f"Image saved to:\n{filename}")
-                    self.logger.info(f"Single capture saved: {filename}")
-                else:
-                    self.log_message("ERROR: Failed to save image")
-                    QMessageBox.warning(self, "Save Failed", "Failed to save the captured image.")
+                # Encode and write the JPEG in the background, result in _on_capture_saved
+                self._submit_save(pixmap.toImage(), filepath)
 
             else:
                 # Mode 2: Worker not running, use soft trigger
-                self.log_message("Camera not streaming. Using soft trigger mode...")
+                self.log_message(logging.INFO, "Camera not streaming. Using soft trigger mode...")
 
                 self.selected_device_index = self.device_combo.currentIndex()
 
@@ -723,153 +1526,298 @@ class CameraControlApp(QMainWindow):
                 if self.selected_device_index < 0:
                     QMessageBox.warning(self, "No Device Selected",
                                       "Please select a camera device first.")
-                    self.log_message("ERROR: No device selected for soft trigger")
+                    self.log_message(logging.ERROR, "ERROR: No device selected for soft trigger")
                     return
 
-                # Track if we need to cleanup (for devices not previously connected)
+                # The handle opened for a previous capture is kept open, so repeated
+                # captures only pay for trigger + transfer. Reopen if the selection changed.
                 need_cleanup = False
-                was_open = self.camera.IMV_IsOpen()
-
+                selected_serial = None
+                if self.selected_device_index < len(self.device_serials):
+                    selected_serial = self.device_serials[self.selected_device_index]
+                if self._capture_serial is not None and self._capture_serial != selected_serial:
+                    self._release_capture_handle()
+                was_open = self.ensure_camera().IMV_IsOpen()
+
+                # Capture progress, so the error path undoes exactly the steps taken
+                state = _CAPTURE_IDLE
+                frame = None
                 try:
                     # If camera is not open, we need to create handle and open it
                     if not was_open:
-                        self.log_message("Creating device handle and opening camera...")
+                        self.log_message(logging.INFO, "Creating device handle and opening camera...")
 
                         # Create device handle
                         ret = self.camera.IMV_CreateHandle(
-                            IMV_ECreateHandleMode.modeByIndex,
+                            IMV.IMV_ECreateHandleMode.modeByIndex,
                             byref(c_uint(self.selected_device_index))
                         )
-                        if ret != IMV_OK:
+                        if ret != IMV.IMV_OK:
                             raise Exception(f"Failed to create device handle. Error code: {ret}")
 
                         need_cleanup = True
 
                         # Open camera
                         ret = self.camera.IMV_Open()
-                        if ret != IMV_OK:
+                        if ret != IMV.IMV_OK:
                             raise Exception(f"Failed to open camera. Error code: {ret}")
 
-                        self.log_message("Camera opened for single capture")
+                        self._capture_serial = selected_serial
+                        self.log_message(logging.INFO, "Camera opened for single capture")
 
                     # Set soft trigger configuration
                     ret = self.camera.IMV_SetEnumFeatureSymbol("TriggerSource", "Software")
-                    if ret != IMV_OK:
+                    if ret != IMV.IMV_OK:
                         raise Exception(f"Failed to set TriggerSource. Error code: {ret}")
 
                     ret = self.camera.IMV_SetEnumFeatureSymbol("TriggerSelector", "FrameStart")
-                    if ret != IMV_OK:
+                    if ret != IMV.IMV_OK:
                         raise Exception(f"Failed to set TriggerSelector. Error code: {ret}")
 
                     ret = self.camera.IMV_SetEnumFeatureSymbol("TriggerMode", "On")
-                    if ret != IMV_OK:
+                    if ret != IMV.IMV_OK:
                         raise Exception(f"Failed to set TriggerMode. Error code: {ret}")
 
-                    self.log_message("Soft trigger configured, starting grab...")
+                    self.log_message(logging.INFO, "Soft trigger configured, starting grab...")
 
                     # Start grabbing
                     ret = self.camera.IMV_StartGrabbing()
-                    if ret != IMV_OK:
+                    if ret != IMV.IMV_OK:
                         raise Exception(f"Failed to start grabbing. Error code: {ret}")
+                    state = _CAPTURE_GRABBING
 
                     # Execute soft trigger
                     ret = self.camera.IMV_ExecuteCommandFeature("TriggerSoftware")
-                    if ret != IMV_OK:
+                    if ret != IMV.IMV_OK:
                         raise Exception(f"Failed to execute soft trigger. Error code: {ret}")
 
                     # Get frame
-                    frame = IMV_Frame()
+                    frame = IMV.IMV_Frame()
                     ret = self.camera.IMV_GetFrame(frame, 1000)
-                    if ret != IMV_OK:
+                    if ret != IMV.IMV_OK:
                         raise Exception(f"Failed to get frame. Error code: {ret}")
+                    state = _CAPTURE_FRAME
 
-                    self.log_message("Frame captured, saving to file...")
-
-                    # Generate filename with timestamp
-                    save_dir = "captured_images"
-
-                    if not os.path.exists(save_dir):
-                        os.makedirs(save_dir)
-                    
-                    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"capture_{timestamp}.jpg"
-
-                    filepath = os.path.join(save_dir, filename)
-
-                    # Prepare save parameters
-                    saveParam = IMV_SaveImageToFileParam()
-                    saveParam.eImageType = IMV_ESaveType.typeImageJpeg
-                    saveParam.nWidth = frame.frameInfo.width
-                    saveParam.nHeight = frame.frameInfo.height
-                    saveParam.nPixelFormat = frame.frameInfo.pixelFormat
-                    saveParam.pSrcData = frame.pData
-                    saveParam.nSrcDataLen = frame.frameInfo.size
-                    saveParam.nBayerDemosaic = 2
-                    saveParam.nQuality = 90
-                    saveParam.pImagePath = filepath.encode("utf-8")
+                    self.log_message(logging.INFO, "Frame captured, saving to file...")
 
-                    # Save image to file
-                    ret = self.camera.IMV_SaveImageToFile(saveParam)
+                    # Generate filename with date and sequence number
+                    filename, filepath = self._next_capture_path()
 
-                    # Release frame
-                    self.camera.IMV_ReleaseFrame(frame)
+                    # Demosaic and encode with OpenCV (SIMD, libjpeg-turbo); pixel
+                    # formats it does not handle fall back to the SDK save
+                    from camera_worker import frame_to_image
+                    try:
+                        image = frame_to_image(frame)
+                    except Exception as convert_error:
+                        self.logger.warning(f"OpenCV frame conversion failed, using SDK save: {convert_error}")
+                        image = None
+
+                    if image is not None:
+                        # Frame data was copied, release the SDK buffer and encode
+                        # in the background, result in _on_capture_saved
+                        self.camera.IMV_ReleaseFrame(frame)
+                        state = _CAPTURE_GRABBING
+                        self._submit_save(image, filepath)
+                        ret = IMV.IMV_OK
+                    else:
+                        # Prepare save parameters
+                        saveParam = IMV.IMV_SaveImageToFileParam()
+                        saveParam.eImageType = IMV.IMV_ESaveType.typeImageJpeg
+                        saveParam.nWidth = frame.frameInfo.width
+                        saveParam.nHeight = frame.frameInfo.height
+                        saveParam.nPixelFormat = frame.frameInfo.pixelFormat
+                        saveParam.pSrcData = frame.pData
+                        saveParam.nSrcDataLen = frame.frameInfo.size
+                        saveParam.nBayerDemosaic = 2
+                        saveParam.nQuality = 90
+                        saveParam.pImagePath = filepath.encode("utf-8")
+
+                        # Save image to file
+                        ret = self.camera.IMV_SaveImageToFile(saveParam)
+
+                        # Release frame
+                        self.camera.IMV_ReleaseFrame(frame)
+                        state = _CAPTURE_GRABBING
 
                     # Stop grabbing
                     self.camera.IMV_StopGrabbing()
+                    state = _CAPTURE_IDLE
 
                     # Restore trigger mode to Off (for normal streaming)
                     self.camera.IMV_SetEnumFeatureSymbol("TriggerMode", "Off")
 
-                    # Cleanup if we opened the camera just for this capture
-                    if need_cleanup:
-                        self.camera.IMV_Close()
-                        self.camera.IMV_DestroyHandle()
-                        self.log_message("Camera closed after single capture")
-
                     # Check save result
-                    if ret != IMV_OK:
+                    if ret != IMV.IMV_OK:
                         raise Exception(f"Failed to save image. Error code: {ret}")
                     
-                    # Load picture to video display widget
+                    # Load picture to video display widget (from memory, the file is
+                    # only read back if the SDK saved it)
                     try:
-                        captured_picture =  QPixmap(filepath)
-                        if not captured_picture.isNull():
-                            scaled_picture = captured_picture.scaled(
-                                self.video_label.size(),
-                                Qt.AspectRatioMode.KeepAspectRatio,
-                                Qt.TransformationMode.FastTransformation
-                            )
-                            self.video_label.setPixmap(scaled_picture)
+                        if image is not None:
+                            self.show_still_picture(image)
+                        else:
+                            captured_picture = QPixmap(filepath)
+                            if not captured_picture.isNull():
+                                self.show_still_picture(captured_picture)
                     except Exception as display_error:
                         self.logger.error(f"Failed to display captured image in video label: {display_error}")
 
-                    self.log_message(f"SUCCESS: Image saved to {filename}")
-                    QMessageBox.information(self, "Capture Success", f"Image saved to:\n{filename}")
-                    self.logger.info(f"Single capture (soft trigger) saved: {filename}")
+                    if image is None:
+                        self.log_message(logging.INFO, f"SUCCESS: Image saved to {filename}")
+                        QMessageBox.information(self, "Capture Success", f"Image saved to:\n{filename}")
+                        self.logger.info(f"Single capture (soft trigger) saved: {filename}")
 
                 except Exception as capture_error:
-                    self.log_message(f"ERROR: Soft trigger capture failed - {str(capture_error)}")
-                    # Cleanup on error if needed
-                    if need_cleanup:
+                    self.log_message(logging.ERROR, f"ERROR: Soft trigger capture failed - {str(capture_error)}")
+                    # Cleanup on error: undo the steps reached, newest first
+                    camera = self.camera
+                    cleanup = []
+                    if state >= _CAPTURE_FRAME:
+                        cleanup.append(lambda: camera.IMV_ReleaseFrame(frame))
+                    if state >= _CAPTURE_GRABBING:
+                        cleanup.append(camera.IMV_StopGrabbing)
+                    if need_cleanup or self._capture_serial is not None:
+                        self._capture_serial = None
+                        cleanup.append(camera.IMV_Close)
+                        cleanup.append(camera.IMV_DestroyHandle)
+                    for step in cleanup:
                         try:
-                            self.camera.IMV_StopGrabbing()
-                        except:
-                            pass
-                        try:
-                            self.camera.IMV_Close()
-                        except:
-                            pass
-                        try:
-                            self.camera.IMV_DestroyHandle()
-                        except:
-                            pass
+                            step()
+                        except Exception as cleanup_error:
+                            self.logger.warning(f"Soft trigger cleanup step failed: {cleanup_error}")
                     raise capture_error
 
         except Exception as e:
-            self.log_message(f"ERROR: Single capture failed - {str(e)}")
+            self.log_message(logging.ERROR, f"ERROR: Single capture failed - {str(e)}")
             self.logger.exception("Single capture error")
             QMessageBox.critical(self, "Capture Error", f"An error occurred:\n{str(e)}")
 
+# Saved default parameters, and the parsed content of each file keyed by
+# (path, mtime, size) so an unchanged file is not read and parsed again
+DEFAULT_CONFIG_FILE = "camera_default_config.json"
+# Complete device configuration saved by the SDK next to the JSON file, so a
+# reset restores all features in one IMV_LoadDeviceCfg call
+DEFAULT_DEVICE_CFG_FILE = "camera_default_config.mvcfg"
+_DEFAULT_CONFIG_CACHE = {}
+
+
+def _default_config_key(path):
+    """Get the cache key of a config file from its current stat."""
+    st = os.stat(path)
+    return (path, st.st_mtime_ns, st.st_size)
+
+
+def load_default_config(path=DEFAULT_CONFIG_FILE):
+    """
+    Load saved default parameters, reusing the parsed file while it is unchanged.
+
+    Args:
+        path: JSON file path
+
+    Returns:
+        dict: Default parameters (a copy the caller may modify)
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    key = _default_config_key(path)
+    params = _DEFAULT_CONFIG_CACHE.get(key)
+    if params is None:
+        import json
+        with open(path, 'r') as f:
+            params = json.load(f)
+        _DEFAULT_CONFIG_CACHE.clear()  # Only the current version is worth keeping
+        _DEFAULT_CONFIG_CACHE[key] = params
+    return dict(params)
+
+
+def save_default_config(params, path=DEFAULT_CONFIG_FILE):
+    """
+    Save default parameters and cache them, so the next load does not read the file.
+
+    The file is left untouched if it already holds the same parameters.
+
+    Args:
+        params: Default parameters
+        path: JSON file path
+
+    Returns:
+        bool: True if the file was written, False if it was already up to date
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    try:
+        if load_default_config(path) == params:
+            return False
+    except (OSError, ValueError):
+        pass  # Missing or unreadable file, write it
+
+    # Serialize first and replace the file in one step, so an interrupted
+    # save never leaves a truncated config behind
+    import json
+    data = json.dumps(params, indent=4)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    _DEFAULT_CONFIG_CACHE.clear()
+    _DEFAULT_CONFIG_CACHE[_default_config_key(path)] = dict(params)
+    return True
+
+
+@contextmanager
+def _log_duration(logger, label):
+    """
+    Log the wall time of a block at DEBUG level.
+
+    Parameter access is dominated by the synchronous SDK round trips to the
+    camera, not by Python code, so timing groups of SDK calls shows which
+    calls are worth removing, caching or batching.
+
+    Args:
+        logger: Logger to write to
+        label: Name of the timed block
+    """
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        logger.debug(f"{label}: {(time.perf_counter_ns() - start) / 1e6:.2f} ms")
+
+
+def _set_string_parameter(camera, name, value):
+    """Write a string feature (default setter of set_camera_parameter)."""
+    return camera.IMV_SetStringFeatureValue(name, value.encode('utf-8'))
+
+
+# Parameter name -> SDK setter (camera, name, value), resolved once instead of
+# branching on the parameter type for every write
+_PARAMETER_SETTERS = {
+    **dict.fromkeys(
+        ("ExposureTime", "GainRaw", "Gamma", "AcquisitionFrameRate", "BalanceRatio"),
+        lambda camera, name, value: camera.IMV_SetDoubleFeatureValue(name, value)
+    ),
+    **dict.fromkeys(
+        ("ExposureAuto", "BalanceWhiteAuto", "BalanceRatioSelector", "PixelFormat"),
+        lambda camera, name, value: camera.IMV_SetEnumFeatureSymbol(name, str(value))
+    ),
+    "AcquisitionFrameRateEnable": lambda camera, name, value: camera.IMV_SetBoolFeatureValue(name, value),
+}
+
+# Features whose writes change the range of another (the frame rate limit
+# depends on the exposure time and vice versa): written -> dependent feature
+_RANGE_DEPENDENT_FEATURES = {
+    "ExposureTime": "AcquisitionFrameRate",
+    "AcquisitionFrameRate": "ExposureTime",
+}
+
+# Longest wait for the worker to stop on pause/resume: its cleanup joins the
+# recognition thread (up to 2 s) and stops grabbing
+_WORKER_STOP_TIMEOUT_MS = 3000
+
+
 # SubWindow to configure camera parameters
 class CameraParameterWindow(QWidget):
     """
@@ -890,6 +1838,17 @@ class CameraParameterWindow(QWidget):
     Balance Ratio: Float type
     """
 
+    # Saved default key -> (feature, control attribute, change handler), in apply order
+    _RESET_HANDLERS = (
+        ('exposure_time', 'ExposureTime', 'exposure_spinbox', 'on_exposure_spinbox_changed'),
+        ('exposure_mode', 'ExposureAuto', 'exposure_mode_combo', 'on_exposure_mode_changed'),
+        ('raw_gain', 'GainRaw', 'gain_spinbox', 'on_gain_spinbox_changed'),
+        ('gamma', 'Gamma', 'gamma_spinbox', 'on_gamma_spinbox_changed'),
+        ('frame_rate', 'AcquisitionFrameRate', 'framerate_spinbox', 'on_framerate_spinbox_changed'),
+        ('pixel_format', 'PixelFormat', 'pixel_format_combo', 'on_pixel_format_changed'),
+        ('balance_auto', 'BalanceWhiteAuto', 'balance_auto_combo', 'on_balance_auto_changed'),
+    )
+
     def __init__(self, worker, camera, logger, parent_window=None):
         super().__init__()
         self.camera = camera
@@ -901,13 +1860,31 @@ class CameraParameterWindow(QWidget):
         self.setGeometry(150, 150, 700, 800)
 
         # --- Use centralized configuration ---
+        from camera_config import CameraConfig
         self.config = CameraConfig()
 
-        # --- Load parameter values from camera ---
-        self.config.load_from_camera(self.camera)
+        # --- Load parameter values (and cached feature ranges) from camera ---
+        self.config.load_from_camera(self.camera, self._device_key())
+        self.config.dirty.clear()
 
-        # Initialize UI
-        self.init_ui()
+        # Editability snapshot, refreshed by update_parameter_editability(),
+        # and the snapshots already queried per stream state and modes (kept
+        # by the config, so reopening the window queries nothing again)
+        self.editability_map = {}
+        self._editability_cache = self.config.editability_cache(self._device_key())
+
+        # {text: index} of each parameter combo box, built once as it is filled
+        self._combo_indexes = {}
+
+        # Out-param for one-off double reads, reused instead of a new c_double per call
+        self._scratch_double = c_double(0)
+
+        # Initialize UI, laid out and painted once when complete
+        self.setUpdatesEnabled(False)
+        try:
+            self.init_ui()
+        finally:
+            self.setUpdatesEnabled(True)
 
         # Load current parameters from camera (Deprecated Function)
         # self.load_parameters()
@@ -915,10 +1892,50 @@ class CameraParameterWindow(QWidget):
         # Update parameter editability based on current camera state
         self.update_parameter_editability()
 
+        # A non-blocking pause finishes once the worker has stopped grabbing
+        self.worker.finished.connect(self._on_worker_stopped)
+
         # --- Timer for continuous mode refresh ---
-        self.refresh_timer = QTimer()
+        # Only runs while the window is shown, the stream is live and an
+        # auto mode is Continuous, see update_refresh_timer()
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(10000)  # Refresh every 10 seconds
         self.refresh_timer.timeout.connect(self.fresh_if_continuous)
-        self.refresh_timer.start(10000)  # Refresh every 10 seconds
+
+    def showEvent(self, event):
+        """Start the continuous mode refresh if needed once the window is shown."""
+        super().showEvent(event)
+        self.update_refresh_timer()
+
+    def hideEvent(self, event):
+        """Stop the continuous mode refresh while the window is hidden."""
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+
+    def update_refresh_timer(self):
+        """Run the continuous mode refresh timer only when there is something to refresh."""
+        continuous = (self.exposure_mode_combo.currentText() == "Continuous"
+                      or self.balance_auto_combo.currentText() == "Continuous")
+        if self.isVisible() and self.is_grabbing and continuous:
+            if not self.refresh_timer.isActive():
+                self.refresh_timer.start()
+        else:
+            self.refresh_timer.stop()
+
+    def _device_key(self):
+        """
+        Get the serial number of the connected device.
+
+        Returns:
+            bytes: Serial number, or None if it is not known
+        """
+        parent = self.parent_window
+        if parent is None:
+            return None
+        index = getattr(parent, "selected_device_index", None)
+        if index is None or not 0 <= index < len(parent.device_serials):
+            return None
+        return parent.device_serials[index]
 
     def init_ui(self):
         """Initialize the user interface with all parameter controls."""
@@ -935,259 +1952,62 @@ class CameraParameterWindow(QWidget):
         stop_layout = QVBoxLayout()
 
         self.toggle_grab_btn = QPushButton("Pause Stream")
+        self.toggle_grab_btn.setObjectName("toggleGrabButton")  # Styled by APP_STYLESHEET
         self.toggle_grab_btn.clicked.connect(self.toggle_grabbing)
-        self.toggle_grab_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                font-weight: bold;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-            }
-        """)
 
         stop_layout.addWidget(self.toggle_grab_btn)
         stop_group.setLayout(stop_layout)
         layout.addWidget(stop_group)
 
         # --- Exposure Time ---
-        # Get exposure time, min, max from camera
-        exposure_group = QGroupBox("Exposure Time (μs)")
-        exposure_layout = QVBoxLayout()
-
-        max_exposure = c_double(0)
-        min_exposure = c_double(0)
-        ret = self.camera.IMV_GetDoubleFeatureMin("ExposureTime", min_exposure)
-        if ret != IMV_OK:
-            self.logger.error(f"Failed to get ExposureTime min: {ret}")
-        ret = self.camera.IMV_GetDoubleFeatureMax("ExposureTime", max_exposure)
-        if ret != IMV_OK:
-            self.logger.error(f"Failed to get ExposureTime max: {ret}")
-
-        self.exposure_spinbox = QDoubleSpinBox()
-        self.exposure_spinbox.setMinimum(min_exposure.value)
-        self.exposure_spinbox.setMaximum(max_exposure.value)
-        self.exposure_spinbox.setSuffix(" μs")
-        # Set value BEFORE connecting signal to avoid triggering during init
-        self.exposure_spinbox.blockSignals(True)
-        self.exposure_spinbox.setValue(self.config.exposure_time.value)
-        self.exposure_spinbox.blockSignals(False)
-        # Removed immediate application - will apply on "Apply All" button click
-
-        exposure_layout.addWidget(self.exposure_spinbox)
-        exposure_group.setLayout(exposure_layout)
-        layout.addWidget(exposure_group)
+        self.exposure_spinbox = self._add_spinbox_group(layout, "ExposureTime", "Exposure Time (μs)", suffix=" μs")
 
         # --- Exposure Mode ---
-        exposure_mode_group = QGroupBox("Auto Exposure Mode")
-        exposure_mode_layout = QHBoxLayout()
-
-        self.exposure_mode_combo = QComboBox()
-        self.exposure_mode_combo.addItems(["Off", "Once", "Continuous"])
-
-        # Set initial value BEFORE connecting signal to avoid triggering during init
-        exposure_mode_str = self.config.exposure_mode.str.decode('utf-8') if self.config.exposure_mode.str else "Off"
-        if exposure_mode_str:
-            self.exposure_mode_combo.blockSignals(True)
-            index = self.exposure_mode_combo.findText(exposure_mode_str)
-            if index >= 0:
-                self.exposure_mode_combo.setCurrentIndex(index)
-            self.exposure_mode_combo.blockSignals(False)
-
-        self.exposure_mode_combo.currentTextChanged.connect(self.on_exposure_mode_changed)
-
-        exposure_mode_layout.addWidget(self.exposure_mode_combo)
-        exposure_mode_group.setLayout(exposure_mode_layout)
-        layout.addWidget(exposure_mode_group)
+        self.exposure_mode_combo = self._add_combo_group(
+            layout, "ExposureAuto", "Auto Exposure Mode",
+            ["Off", "Once", "Continuous"], self.on_exposure_mode_changed, "Off")
 
         # --- Raw Gain ---
-        gain_group = QGroupBox("Raw Gain (dB)")
-        gain_layout = QVBoxLayout()
-
-        max_gain = c_double(0)
-        min_gain = c_double(0)
-        ret = self.camera.IMV_GetDoubleFeatureMin("GainRaw", min_gain)
-        if ret != IMV_OK:
-            self.logger.error(f"Failed to get GainRaw min: {ret}")
-        ret = self.camera.IMV_GetDoubleFeatureMax("GainRaw", max_gain)
-        if ret != IMV_OK:
-            self.logger.error(f"Failed to get GainRaw max: {ret}")
-
-        self.gain_spinbox = QDoubleSpinBox()
-        self.gain_spinbox.setMinimum(min_gain.value)
-        self.gain_spinbox.setMaximum(max_gain.value)
-        self.gain_spinbox.setSingleStep(0.1)
-        self.gain_spinbox.setSuffix(" dB")
-        # Set value BEFORE connecting signal
-        self.gain_spinbox.blockSignals(True)
-        self.gain_spinbox.setValue(self.config.raw_gain.value)
-        self.gain_spinbox.blockSignals(False)
-        # Removed immediate application - will apply on "Apply All" button click
-
-        gain_layout.addWidget(self.gain_spinbox)
-        gain_group.setLayout(gain_layout)
-        layout.addWidget(gain_group)
+        self.gain_spinbox = self._add_spinbox_group(layout, "GainRaw", "Raw Gain (dB)", suffix=" dB", step=0.1)
 
         # --- Gamma ---
-        gamma_group = QGroupBox("Gamma")
-        gamma_layout = QVBoxLayout()
-
-        max_gamma = c_double(0)
-        min_gamma = c_double(0)
-        ret = self.camera.IMV_GetDoubleFeatureMin("Gamma", min_gamma)
-        if ret != IMV_OK:
-            self.logger.error(f"Failed to get Gamma min: {ret}")
-        ret = self.camera.IMV_GetDoubleFeatureMax("Gamma", max_gamma)
-        if ret != IMV_OK:
-            self.logger.error(f"Failed to get Gamma max: {ret}")
-
-        self.gamma_spinbox = QDoubleSpinBox()
-        self.gamma_spinbox.setMinimum(min_gamma.value)
-        self.gamma_spinbox.setMaximum(max_gamma.value)
-        self.gamma_spinbox.setSingleStep(0.1)
-        # Set value BEFORE connecting signal
-        self.gamma_spinbox.blockSignals(True)
-        self.gamma_spinbox.setValue(self.config.gamma.value)
-        self.gamma_spinbox.blockSignals(False)
-        # Removed immediate application - will apply on "Apply All" button click
-
-        gamma_layout.addWidget(self.gamma_spinbox)
-        gamma_group.setLayout(gamma_layout)
-        layout.addWidget(gamma_group)
+        self.gamma_spinbox = self._add_spinbox_group(layout, "Gamma", "Gamma", step=0.1)
 
         # --- Frame Rate ---
-        framerate_group = QGroupBox("Frame Rate (fps)")
-        framerate_layout = QVBoxLayout()
-
-        min_framerate = c_double(0)
-        max_framerate = c_double(0)
-        ret = self.camera.IMV_GetDoubleFeatureMin("AcquisitionFrameRate", min_framerate)
-        if ret != IMV_OK:
-            self.logger.error(f"Failed to get AcquisitionFrameRate min: {ret}")
-        ret = self.camera.IMV_GetDoubleFeatureMax("AcquisitionFrameRate", max_framerate)
-        if ret != IMV_OK:
-            self.logger.error(f"Failed to get AcquisitionFrameRate max: {ret}")
-
-        self.framerate_spinbox = QDoubleSpinBox()
-        self.framerate_spinbox.setMinimum(min_framerate.value)
-        self.framerate_spinbox.setMaximum(max_framerate.value)
-        self.framerate_spinbox.setSuffix(" fps")
-        # Set value BEFORE connecting signal
-        self.framerate_spinbox.blockSignals(True)
-        self.framerate_spinbox.setValue(self.config.frame_rate.value)
-        self.framerate_spinbox.blockSignals(False)
-        # Removed immediate application - will apply on "Apply All" button click
-
-        framerate_layout.addWidget(self.framerate_spinbox)
-        framerate_group.setLayout(framerate_layout)
-        layout.addWidget(framerate_group)
+        self.framerate_spinbox = self._add_spinbox_group(
+            layout, "AcquisitionFrameRate", "Frame Rate (fps)", suffix=" fps")
 
         # --- IP Address ---
         ip_group = QGroupBox("IP Address")
         ip_layout = QHBoxLayout()
 
         self.ip_input = QLineEdit()
-        self.ip_input.setPlaceholderText(self.config.ip_address.str.decode('utf-8') if self.config.ip_address.str else "Enter IP Address")
+        self.ip_input.setPlaceholderText(self.config.get_value("GevCurrentIPAddress") or "Enter IP Address")
         # Removed immediate application - will apply on "Apply All" button click
+        self.ip_input.textEdited.connect(self.on_ip_edited)
 
         ip_layout.addWidget(self.ip_input)
         ip_group.setLayout(ip_layout)
         layout.addWidget(ip_group)
 
         # --- Pixel Format ---
-        pixel_format_group = QGroupBox("Pixel Format")
-        pixel_format_layout = QHBoxLayout()
-
-        self.pixel_format_combo = QComboBox()
-        self.pixel_format_combo.addItems(["BayerRG8", "BayerRG10", "BayerRG12", "BayerRG10Packed", "BayerRG12Packed", "YUV422Packed"])
-
-        # See initial value BEFORE connecting signal
-        pixel_format_string = self.config.pixel_format.str.decode("utf-8") if self.config.pixel_format.str else ""
-        if pixel_format_string:
-            self.pixel_format_combo.blockSignals(True)
-            index = self.pixel_format_combo.findText(pixel_format_string)
-            if index >= 0:
-                self.pixel_format_combo.setCurrentIndex(index)
-            self.pixel_format_combo.blockSignals(False)
-
-        self.pixel_format_combo.currentTextChanged.connect(self.on_pixel_format_changed)
-
-        pixel_format_layout.addWidget(self.pixel_format_combo)
-        pixel_format_group.setLayout(pixel_format_layout)
-        layout.addWidget(pixel_format_group)
+        self.pixel_format_combo = self._add_combo_group(
+            layout, "PixelFormat", "Pixel Format",
+            ["BayerRG8", "BayerRG10", "BayerRG12", "BayerRG10Packed", "BayerRG12Packed", "YUV422Packed"],
+            self.on_pixel_format_changed)
 
         # --- Balance White Auto ---
-        balance_auto_group = QGroupBox("Balance White Auto")
-        balance_auto_layout = QHBoxLayout()
-
-        self.balance_auto_combo = QComboBox()
-        self.balance_auto_combo.addItems(["Off", "Once", "Continuous"])
-
-        # Set initial value BEFORE connecting signal
-        balance_auto_string = self.config.balance_auto.str.decode('utf-8') if self.config.balance_auto.str else "Off"
-        if balance_auto_string:
-            self.balance_auto_combo.blockSignals(True)
-            index = self.balance_auto_combo.findText(balance_auto_string)
-            if index >= 0:
-                self.balance_auto_combo.setCurrentIndex(index)
-            self.balance_auto_combo.blockSignals(False)
-
-        self.balance_auto_combo.currentTextChanged.connect(self.on_balance_auto_changed)
-        
-        balance_auto_layout.addWidget(self.balance_auto_combo)
-        balance_auto_group.setLayout(balance_auto_layout)
-        layout.addWidget(balance_auto_group)
+        self.balance_auto_combo = self._add_combo_group(
+            layout, "BalanceWhiteAuto", "Balance White Auto",
+            ["Off", "Once", "Continuous"], self.on_balance_auto_changed, "Off")
 
         # --- Balance Ratio Selector ---
-        balance_selector_group = QGroupBox("Balance Ratio Selector")
-        balance_selector_layout = QHBoxLayout()
-
-        self.balance_selector_combo = QComboBox()
-        self.balance_selector_combo.addItems(["Red", "Green", "Blue"])
-
-        # Set initial value BEFORE connecting signal
-        balance_selector_string = self.config.balance_ratio_selector.str.decode('utf-8') if self.config.balance_ratio_selector.str else "Off"
-        if balance_selector_string:
-            self.balance_selector_combo.blockSignals(True)
-            index = self.balance_selector_combo.findText(balance_selector_string)
-            if index >= 0:
-                self.balance_selector_combo.setCurrentIndex(index)
-            self.balance_selector_combo.blockSignals(False)
-
-        self.balance_selector_combo.currentTextChanged.connect(self.on_balance_selector_changed)
-
-        balance_selector_layout.addWidget(self.balance_selector_combo)
-        balance_selector_group.setLayout(balance_selector_layout)
-        layout.addWidget(balance_selector_group)
+        self.balance_selector_combo = self._add_combo_group(
+            layout, "BalanceRatioSelector", "Balance Ratio Selector",
+            ["Red", "Green", "Blue"], self.on_balance_selector_changed)
 
         # --- Balance Ratio ---
-        balance_ratio_group = QGroupBox("Balance Ratio")
-        balance_ratio_layout = QVBoxLayout()
-
-        balance_ratio_max = c_double(0)
-        balance_ratio_min = c_double(0)
-        ret = self.camera.IMV_GetDoubleFeatureMin("BalanceRatio", balance_ratio_min)
-        if ret != IMV_OK:
-            self.logger.error(f"Failed to get BalanceRatio min: {ret}")
-        ret = self.camera.IMV_GetDoubleFeatureMax("BalanceRatio", balance_ratio_max)
-        if ret != IMV_OK:
-            self.logger.error(f"Failed to get BalanceRatio max: {ret}")
-
-        self.balance_ratio_spinbox = QDoubleSpinBox()
-        self.balance_ratio_spinbox.setMinimum(balance_ratio_min.value)
-        self.balance_ratio_spinbox.setMaximum(balance_ratio_max.value)
-        self.balance_ratio_spinbox.setSingleStep(0.1)
-        # Set value BEFORE connecting signal
-        self.balance_ratio_spinbox.blockSignals(True)
-        self.balance_ratio_spinbox.setValue(self.config.balance_ratio.value)
-        self.balance_ratio_spinbox.blockSignals(False)
-        # Removed immediate application - will apply on "Apply All" button click
-
-        balance_ratio_layout.addWidget(self.balance_ratio_spinbox)
-        balance_ratio_group.setLayout(balance_ratio_layout)
-        layout.addWidget(balance_ratio_group)
+        self.balance_ratio_spinbox = self._add_spinbox_group(layout, "BalanceRatio", "Balance Ratio", step=0.1)
 
         # --- Buttons ---
         button_layout = QHBoxLayout()
@@ -1214,11 +2034,98 @@ class CameraParameterWindow(QWidget):
         main_layout.addWidget(scroll)
         self.setLayout(main_layout)
 
+    def _add_spinbox_group(self, layout, feature, title, suffix="", step=None):
+        """
+        Add a group with a spinbox for a float feature.
+
+        The range and value come from the config; edits are recorded in
+        config.dirty and written by apply_all_parameters.
+
+        Args:
+            layout: Layout to add the group to
+            feature: Feature name
+            title: Group box title
+            suffix: Unit suffix shown in the spinbox
+            step: Single step, or None for the default
+
+        Returns:
+            QDoubleSpinBox: The spinbox
+        """
+        group = QGroupBox(title)
+        group_layout = QVBoxLayout()
+
+        min_value, max_value = self.config.get_range(feature)
+        spinbox = QDoubleSpinBox()
+        spinbox.setRange(min_value, max_value)
+        if step is not None:
+            spinbox.setSingleStep(step)
+        if suffix:
+            spinbox.setSuffix(suffix)
+        # Set value BEFORE connecting signal to avoid triggering during init
+        with QSignalBlocker(spinbox):
+            spinbox.setValue(self.config.get_value(feature))
+        spinbox.valueChanged.connect(lambda value: self.config.mark_dirty(feature, value))
+
+        group_layout.addWidget(spinbox)
+        group.setLayout(group_layout)
+        layout.addWidget(group)
+        return spinbox
+
+    def _add_combo_group(self, layout, feature, title, items, handler, default=""):
+        """
+        Add a group with a combo box for an enum feature, applied on change.
+
+        Args:
+            layout: Layout to add the group to
+            feature: Feature name
+            title: Group box title
+            items: Symbols offered in the combo box
+            handler: Slot called with the new text
+            default: Symbol to select if the feature value is empty
+
+        Returns:
+            QComboBox: The combo box
+        """
+        group = QGroupBox(title)
+        group_layout = QHBoxLayout()
+
+        combo = QComboBox()
+        combo.addItems(items)
+        self._combo_indexes[combo] = {text: i for i, text in enumerate(items)}
+
+        # Set initial value BEFORE connecting signal to avoid triggering during init
+        current = self.config.get_value(feature) or default
+        index = self._find_combo_text(combo, current)
+        if index >= 0:
+            with QSignalBlocker(combo):
+                combo.setCurrentIndex(index)
+
+        combo.currentTextChanged.connect(handler)
+
+        group_layout.addWidget(combo)
+        group.setLayout(group_layout)
+        layout.addWidget(group)
+        return combo
+
+    def _find_combo_text(self, combo, text):
+        """
+        Look up the index of a text in a parameter combo box without scanning its model.
+
+        Args:
+            combo: QComboBox created by _add_combo_group()
+            text: Item text
+
+        Returns:
+            int: Item index, or -1 if the combo box has no such item
+        """
+        return self._combo_indexes[combo].get(text, -1)
+
     # --- Event Handlers for Exposure Time ---
     def on_exposure_spinbox_changed(self, value):
         """Handle exposure spinbox change."""
         if self.config.get_editability(self.camera, "ExposureTime"):
-            self.set_camera_parameter("ExposureTime", value)
+            if self.set_camera_parameter("ExposureTime", value):
+                self.config.store_value("ExposureTime", value)
 
     # --- Event Handlers for Auto Exposure Mode ---
     def on_exposure_mode_changed(self, text):
@@ -1226,24 +2133,28 @@ class CameraParameterWindow(QWidget):
         if self.config.get_editability(self.camera, "ExposureAuto"):
             self.set_camera_parameter("ExposureAuto", text)
             self.update_parameter_editability()
+        self.update_refresh_timer()
 
     # --- Event Handlers for Gain ---
     def on_gain_spinbox_changed(self, value):
         """Handle gain spinbox change."""
         if self.config.get_editability(self.camera, "GainRaw"):
-            self.set_camera_parameter("GainRaw", value)
+            if self.set_camera_parameter("GainRaw", value):
+                self.config.store_value("GainRaw", value)
 
     # --- Event Handlers for Gamma ---
     def on_gamma_spinbox_changed(self, value):
         """Handle gamma spinbox change."""
         if self.config.get_editability(self.camera, "Gamma"):
-            self.set_camera_parameter("Gamma", value)
+            if self.set_camera_parameter("Gamma", value):
+                self.config.store_value("Gamma", value)
 
     # --- Event Handlers for Frame Rate ---
     def on_framerate_spinbox_changed(self, value):
         """Handle frame rate spinbox change."""
         if self.config.get_editability(self.camera, "AcquisitionFrameRate"):
-            self.set_camera_parameter("AcquisitionFrameRate", value)
+            if self.set_camera_parameter("AcquisitionFrameRate", value):
+                self.config.store_value("AcquisitionFrameRate", value)
             self.set_camera_parameter("AcquisitionFrameRateEnable", True)
 
     # --- Event Handlers for IP Address ---
@@ -1253,11 +2164,47 @@ class CameraParameterWindow(QWidget):
             ip_address = self.ip_input.text()
             self.set_camera_parameter("IPAddress", ip_address)
 
+    def on_ip_edited(self, text):
+        """Record an edited IP address; an empty field keeps the current address."""
+        if text:
+            self.config.mark_dirty("GevCurrentIPAddress", text)
+        else:
+            self.config.dirty.pop("GevCurrentIPAddress", None)
+
     # --- Event Handlers for Pixel Format ---
     def on_pixel_format_changed(self, text):
         """Handle pixel format change."""
         if self.config.get_editability(self.camera, "PixelFormat"):
             self.set_camera_parameter("PixelFormat", text)
+            # Ranges depend on the pixel format (e.g. max frame rate)
+            self.config.invalidate_ranges()
+            self.config.load_ranges(self.camera, self._device_key())
+            self.update_spinbox_ranges()
+
+    def update_spinbox_ranges(self, ranges=None):
+        """
+        Apply feature ranges to the spinboxes.
+
+        Args:
+            ranges: Feature name -> (min, max) to apply; None applies all
+                    cached ranges
+        """
+        spinbox_map = {
+            "ExposureTime": self.exposure_spinbox,
+            "GainRaw": self.gain_spinbox,
+            "Gamma": self.gamma_spinbox,
+            "AcquisitionFrameRate": self.framerate_spinbox,
+            "BalanceRatio": self.balance_ratio_spinbox
+        }
+        for feature, spinbox in spinbox_map.items():
+            if ranges is None:
+                min_value, max_value = self.config.get_range(feature)
+            elif feature in ranges:
+                min_value, max_value = ranges[feature]
+            else:
+                continue
+            with QSignalBlocker(spinbox):
+                spinbox.setRange(min_value, max_value)
 
     # --- Event Handlers for Balance White Auto ---
     def on_balance_auto_changed(self, text):
@@ -1265,6 +2212,7 @@ class CameraParameterWindow(QWidget):
         if self.config.get_editability(self.camera, "BalanceWhiteAuto"):
             self.set_camera_parameter("BalanceWhiteAuto", text)
             self.update_parameter_editability()
+        self.update_refresh_timer()
 
     # --- Event Handlers for Balance Ratio Selector ---
     def on_balance_selector_changed(self, text):
@@ -1279,40 +2227,34 @@ class CameraParameterWindow(QWidget):
     def on_balance_ratio_spinbox_changed(self, value):
         """Handle balance ratio spinbox change."""
         if self.config.get_editability(self.camera, "BalanceRatio"):
-            self.set_camera_parameter("BalanceRatio", value)
+            if self.set_camera_parameter("BalanceRatio", value):
+                self.config.store_value("BalanceRatio", value)
 
     # --- Camera Parameter Methods ---
     def set_camera_parameter(self, param_name, value):
-        """Set a camera parameter."""
+        """
+        Set a camera parameter.
+
+        Returns:
+            bool: True if the value was written, False otherwise
+        """
         try:
-            if param_name in ["ExposureTime", "GainRaw", "Gamma", "AcquisitionFrameRate", "BalanceRatio"]:
-                ret = self.camera.IMV_SetDoubleFeatureValue(param_name, value)
-                if ret == IMV_OK:
-                    logging.info(f"Setting {param_name} to {value}")
-                else:
-                    raise Exception(f"Failed to set {param_name} to {value}. Error code: {ret}")
-            elif param_name in ["ExposureAuto", "BalanceWhiteAuto", "BalanceRatioSelector", "PixelFormat"]:
-                ret = self.camera.IMV_SetEnumFeatureSymbol(param_name, str(value))
-                if ret == IMV_OK:
-                    logging.info(f"Setting {param_name} to {value}")
-                else:
-                    raise Exception(f"Failed to set {param_name} to {value}. Error code: {ret}")
-            elif param_name == "AcquisitionFrameRateEnable":
-                ret = self.camera.IMV_SetBoolFeatureValue(param_name, value)
-                if ret == IMV_OK:
-                    logging.info(f"Setting {param_name} to {value}")
-                else:
-                    raise Exception(f"Failed to set {param_name} to {value}. Error code: {ret}")
-            else:  # String parameters
-                ret = self.camera.IMV_SetStringFeatureValue(param_name, value.encode('utf-8'))
-                if ret == IMV_OK:
-                    logging.info(f"Setting {param_name} to {value}")
-                else:
-                    raise Exception(f"Failed to set {param_name}. Error code: {ret}")
+            setter = _PARAMETER_SETTERS.get(param_name, _set_string_parameter)
+            ret = setter(self.camera, param_name, value)
+            if ret != IMV.IMV_OK:
+                raise Exception(f"Failed to set {param_name} to {value}. Error code: {ret}")
+            logging.info(f"Setting {param_name} to {value}")
+            dependent = _RANGE_DEPENDENT_FEATURES.get(param_name)
+            if dependent is not None:
+                dependent_range = self.config.refresh_range(self.camera, dependent)
+                if dependent_range is not None:
+                    self.update_spinbox_ranges({dependent: dependent_range})
+            return True
 
         except Exception as e:
             logging.error(f"Failed to set {param_name} to {value}: {e}")
             QMessageBox.warning(self, "Parameter Error", f"Failed to set {param_name}: {str(e)}")
+            return False
 
 # Deprecated Method:
     # def load_parameters(self):
@@ -1379,18 +2321,51 @@ class CameraParameterWindow(QWidget):
             logging.error(f"Failed to load balance ratio: {e}")
 
     def apply_all_parameters(self):
-        """Apply all text input parameters to camera. Dropdown menus are applied immediately."""
+        """
+        Apply the edited text input parameters to camera in one batch.
+
+        Only values recorded in config.dirty are written, and editability is
+        taken from the snapshot instead of being queried per parameter.
+        Values that are not editable or fail to write stay dirty, so they are
+        retried by the next apply. Dropdown menus are applied immediately.
+        """
         try:
-            # Apply text input parameters (SpinBox and LineEdit)
-            # Note: Dropdown menus (ComboBox) are already applied immediately on change
-            self.on_exposure_spinbox_changed(self.exposure_spinbox.value())
-            self.on_gain_spinbox_changed(self.gain_spinbox.value())
-            self.on_gamma_spinbox_changed(self.gamma_spinbox.value())
-            self.on_framerate_spinbox_changed(self.framerate_spinbox.value())
-            self.on_ip_changed()
-            self.on_balance_ratio_spinbox_changed(self.balance_ratio_spinbox.value())
-
-            QMessageBox.information(self, "Success", "All parameters applied successfully!")
+            # Step 1: Write each edited value the camera currently accepts
+            applied = []
+            skipped = []
+            failed = []
+            for param_name, value in list(self.config.dirty.items()):
+                if not self.editability_map.get(param_name, False):
+                    self.logger.info(f"Skipping '{param_name}': not editable")
+                    skipped.append(param_name)  # Stays dirty until it is editable
+                    continue
+
+                if param_name == "GevCurrentIPAddress":
+                    ok = self.set_camera_parameter("IPAddress", value)
+                else:
+                    ok = self.set_camera_parameter(param_name, value)
+                if ok and param_name == "AcquisitionFrameRate":
+                    ok = self.set_camera_parameter("AcquisitionFrameRateEnable", True)
+
+                if ok:
+                    self.config.store_value(param_name, value)
+                    applied.append(param_name)
+                else:
+                    failed.append(param_name)  # Stays dirty for the next apply
+
+            # Step 2: Report the result
+            if skipped or failed:
+                lines = [f"Applied {len(applied)} parameter(s)."]
+                if skipped:
+                    lines.append(f"Not editable now: {', '.join(skipped)}")
+                if failed:
+                    lines.append(f"Failed to apply: {', '.join(failed)}")
+                self.logger.warning(f"Parameters not applied: {', '.join(skipped + failed)}")
+                QMessageBox.warning(self, "Parameters Not Applied", "\n".join(lines))
+            elif applied:
+                QMessageBox.information(self, "Success", "All parameters applied successfully!")
+            else:
+                self.show_status("No parameter changes to apply")
             self.update_parameter_editability()
         except Exception as e:
             logging.error(f"Failed to apply parameters: {e}")
@@ -1398,9 +2373,11 @@ class CameraParameterWindow(QWidget):
 
     def reset_to_default(self):
         """Reset all parameters to default values from saved configuration file."""
+        import json  # For json.JSONDecodeError
+
         try:
             # Define default config file path
-            config_file = "camera_default_config.json"
+            config_file = DEFAULT_CONFIG_FILE
 
             if not os.path.exists(config_file):
                 QMessageBox.warning(
@@ -1410,9 +2387,12 @@ class CameraParameterWindow(QWidget):
                 )
                 return
 
-            # Load default parameters from JSON file
-            with open(config_file, 'r') as f:
-                default_params = json.load(f)
+            # Load default parameters from JSON file (cached while unchanged)
+            default_params = load_default_config(config_file)
+
+            # Current camera values, so parameters already at their default are not written
+            with _log_duration(self.logger, "reset: read camera values"):
+                self.config.load_from_camera(self.camera, self._device_key())
 
             # Stop grabbing before applying parameters
             was_grabbing = self.is_grabbing
@@ -1421,79 +2401,85 @@ class CameraParameterWindow(QWidget):
 
             # Apply each parameter to camera
             try:
-                # Apply exposure time
-                if 'exposure_time' in default_params:
-                    self.on_exposure_spinbox_changed(default_params['exposure_time'])
-                    self.exposure_spinbox.setValue(default_params['exposure_time'])
-
-                # Apply exposure mode
-                if 'exposure_mode' in default_params:
-                    self.on_exposure_mode_changed(default_params['exposure_mode'])
-                    index = self.exposure_mode_combo.findText(default_params['exposure_mode'])
-                    if index >= 0:
-                        self.exposure_mode_combo.setCurrentIndex(index)
-
-                # Apply gain
-                if 'raw_gain' in default_params:
-                    self.on_gain_spinbox_changed(default_params['raw_gain'])
-                    self.gain_spinbox.setValue(default_params['raw_gain'])
-
-                # Apply gamma
-                if 'gamma' in default_params:
-                    self.on_gamma_spinbox_changed(default_params['gamma'])
-                    self.gamma_spinbox.setValue(default_params['gamma'])
-
-                # Apply frame rate
-                if 'frame_rate' in default_params:
-                    self.on_framerate_spinbox_changed(default_params['frame_rate'])
-                    self.framerate_spinbox.setValue(default_params['frame_rate'])
-
-                # Apply pixel format
-                if 'pixel_format' in default_params:
-                    self.on_pixel_format_changed(default_params['pixel_format'])
-                    index = self.pixel_format_combo.findText(default_params['pixel_format'])
-                    if index >= 0:
-                        self.pixel_format_combo.setCurrentIndex(index)
-
-                # Apply balance white auto
-                if 'balance_auto' in default_params:
-                    self.on_balance_auto_changed(default_params['balance_auto'])
-                    index = self.balance_auto_combo.findText(default_params['balance_auto'])
-                    if index >= 0:
-                        self.balance_auto_combo.setCurrentIndex(index)
-
-                # Apply balance ratios for all three channels
-                # Save current selector to restore later
-                current_selector = default_params.get('balance_ratio_selector', 'Red')
+                # Restore the saved device configuration in one SDK call if it
+                # is available; the per-parameter pass below then finds the
+                # camera values matching and only updates the controls
+                with _log_duration(self.logger, "reset: load device configuration"):
+                    device_loaded = self._load_device_defaults(config_file)
+                    if device_loaded:
+                        self.config.invalidate_ranges()
+                        self.config.load_from_camera(self.camera, self._device_key())
+                        self.update_spinbox_ranges()
+
+                # Apply each value once: the control is updated silently, then
+                # its handler writes the camera unless it already holds the value
+                with _log_duration(self.logger, "reset: apply parameters"):
+                    for param_key, feature, control_name, handler_name in self._RESET_HANDLERS:
+                        value = default_params.get(param_key)
+                        if value is None:
+                            continue
+                        handler = getattr(self, handler_name)
+                        if self._matches_camera(feature, value):
+                            self.config.dirty.pop(feature, None)
+                            handler = None
+                        self._apply_default(getattr(self, control_name), value, handler)
+
+                # Apply balance ratios for all three channels. The target selector
+                # is visited last, so the selector ends on it without a restore,
+                # and the selector is only switched when it changes
+                target_selector = default_params.get('balance_ratio_selector', 'Red')
+                selector = self.config.get_value("BalanceRatioSelector")
+                channels = [('Red', 'balance_ratio_red'),
+                            ('Green', 'balance_ratio_green'),
+                            ('Blue', 'balance_ratio_blue')]
+                channels.sort(key=lambda item: item[0] == target_selector)
+                if device_loaded:
+                    channels = []  # Restored with the device configuration
 
                 # Apply balance ratio for each channel
-                for channel, param_key in [('Red', 'balance_ratio_red'),
-                                           ('Green', 'balance_ratio_green'),
-                                           ('Blue', 'balance_ratio_blue')]:
-                    if param_key in default_params:
-                        # Set selector to the channel
-                        ret = self.camera.IMV_SetEnumFeatureSymbol("BalanceRatioSelector", channel)
-                        if ret == IMV_OK:
-                            # Apply the balance ratio for this channel
-                            ret = self.camera.IMV_SetDoubleFeatureValue("BalanceRatio", default_params[param_key])
-                            if ret == IMV_OK:
-                                self.logger.info(f"Applied BalanceRatio for {channel}: {default_params[param_key]}")
-                            else:
-                                self.logger.error(f"Failed to set BalanceRatio for {channel}. Error code: {ret}")
+                with _log_duration(self.logger, "reset: apply balance ratios"):
+                    for channel, param_key in channels:
+                        if param_key not in default_params:
+                            continue
+                        if channel != selector:
+                            # Set selector to the channel
+                            ret = self.camera.IMV_SetEnumFeatureSymbol("BalanceRatioSelector", channel)
+                            if ret != IMV.IMV_OK:
+                                self.logger.error(f"Failed to set BalanceRatioSelector to {channel}. Error code: {ret}")
+                                continue
+                            selector = channel
+                        # Apply the balance ratio for this channel (the loaded value is this channel's)
+                        if channel == self.config.get_value("BalanceRatioSelector") and \
+                                self._matches_camera("BalanceRatio", default_params[param_key]):
+                            continue
+                        ret = self.camera.IMV_SetDoubleFeatureValue("BalanceRatio", default_params[param_key])
+                        if ret == IMV.IMV_OK:
+                            self.logger.info(f"Applied BalanceRatio for {channel}: {default_params[param_key]}")
+                            if channel == target_selector:
+                                self.config.store_value("BalanceRatio", default_params[param_key])
                         else:
-                            self.logger.error(f"Failed to set BalanceRatioSelector to {channel}. Error code: {ret}")
+                            self.logger.error(f"Failed to set BalanceRatio for {channel}. Error code: {ret}")
+                if selector:
+                    self.config.store_value("BalanceRatioSelector", selector)
 
-                # Restore the balance ratio selector to the saved value
+                # Make sure the selector ends on the saved value (only if a channel was skipped)
                 if 'balance_ratio_selector' in default_params:
-                    self.camera.IMV_SetEnumFeatureSymbol("BalanceRatioSelector", default_params['balance_ratio_selector'])
-                    index = self.balance_selector_combo.findText(default_params['balance_ratio_selector'])
+                    if selector != target_selector:
+                        self.camera.IMV_SetEnumFeatureSymbol("BalanceRatioSelector", target_selector)
+                        self.config.load_from_camera(self.camera)
+                    index = self._find_combo_text(self.balance_selector_combo, target_selector)
                     if index >= 0:
-                        self.balance_selector_combo.setCurrentIndex(index)
-                    # Update the displayed balance ratio for the current selector
-                    self.load_balance_ratio()
+                        with QSignalBlocker(self.balance_selector_combo):
+                            self.balance_selector_combo.setCurrentIndex(index)
+                    # Show the balance ratio of the selected channel, already known
+                    with QSignalBlocker(self.balance_ratio_spinbox):
+                        self.balance_ratio_spinbox.setValue(self.config.balance_ratio.value)
+
+                if device_loaded:
+                    self.update_refresh_timer()  # Auto modes changed without their handlers
 
                 self.logger.info("Successfully reset parameters to default values")
-                QMessageBox.information(self, "Success", "Parameters have been reset to default values!")
+                self.show_status("Parameters have been reset to default values")
 
             finally:
                 # Resume grabbing if it was active before
@@ -1510,6 +2496,109 @@ class CameraParameterWindow(QWidget):
             self.logger.error(f"Failed to reset to default: {e}")
             QMessageBox.critical(self, "Error", f"Failed to reset parameters: {str(e)}")
 
+    def _load_device_defaults(self, config_file):
+        """
+        Load the device configuration saved by set_as_default() into the camera.
+
+        It is only used if it is not older than the JSON default configuration,
+        so a hand-edited JSON file is not overridden by a stale device file.
+
+        Args:
+            config_file: JSON default configuration file
+
+        Returns:
+            bool: True if every feature was restored, False if the caller has to
+                  apply the parameters one by one
+        """
+        cfg_file = DEFAULT_DEVICE_CFG_FILE
+        if not hasattr(self.camera, "IMV_LoadDeviceCfg") or not os.path.exists(cfg_file):
+            return False
+        if os.path.getmtime(cfg_file) < os.path.getmtime(config_file):
+            self.logger.info(f"{cfg_file} is older than {config_file}, applying parameters one by one")
+            return False
+
+        error_list = IMV.IMV_ErrorList()
+        ret = self.camera.IMV_LoadDeviceCfg(cfg_file, error_list)
+        if ret != IMV.IMV_OK or error_list.nParamCnt:
+            failed = [error_list.paramNameList[i].str.decode('utf-8', 'replace')
+                      for i in range(error_list.nParamCnt)]
+            self.logger.warning(f"Failed to load {cfg_file}. Error code: {ret}, failed features: {failed}")
+            return False
+
+        self.logger.info(f"Loaded device configuration from {cfg_file}")
+        return True
+
+    def _save_device_defaults(self):
+        """
+        Save the complete device configuration next to the JSON defaults.
+
+        A device file that could not be refreshed is removed, so a reset never
+        restores an outdated configuration from it.
+        """
+        cfg_file = DEFAULT_DEVICE_CFG_FILE
+        if not hasattr(self.camera, "IMV_SaveDeviceCfg"):
+            return
+        ret = self.camera.IMV_SaveDeviceCfg(cfg_file)
+        if ret == IMV.IMV_OK:
+            self.logger.info(f"Saved device configuration to {cfg_file}")
+            return
+
+        self.logger.error(f"Failed to save device configuration. Error code: {ret}")
+        try:
+            os.remove(cfg_file)
+        except FileNotFoundError:
+            pass
+
+    def show_status(self, message, timeout=5000):
+        """
+        Report a success without a modal dialog: in the main window's status bar and log.
+
+        Args:
+            message: Text to show
+            timeout: Status bar display time in ms
+        """
+        if self.parent_window is None:
+            QMessageBox.information(self, "Success", message)
+            return
+        self.parent_window.statusBar().showMessage(message, timeout)
+        self.parent_window.log_message(logging.INFO, message)
+
+    def _apply_default(self, control, value, handler):
+        """
+        Show a default value in its control without emitting signals, then apply it once.
+
+        Args:
+            control: QDoubleSpinBox or QComboBox showing the parameter
+            value: Default value (number, or combo text)
+            handler: Change handler that writes the value to the camera, or
+                     None if the camera already holds it
+        """
+        with QSignalBlocker(control):
+            if isinstance(control, QComboBox):
+                index = self._find_combo_text(control, value)
+                if index >= 0:
+                    control.setCurrentIndex(index)
+            else:
+                control.setValue(value)
+        if handler is not None:
+            handler(value)
+
+    def _matches_camera(self, feature, value):
+        """
+        Check whether the last loaded camera value of a feature equals value.
+
+        Args:
+            feature: Feature name
+            value: Value to compare (number or symbol)
+
+        Returns:
+            bool: True if writing value would not change the camera
+        """
+        current = self.config.get_value(feature)
+        if isinstance(current, float) and isinstance(value, (int, float)):
+            return abs(current - value) < 1e-6
+        return current == value
+
     def set_as_default(self):
         """Set current parameters to a configuration file as default."""
         try:
@@ -1519,19 +2608,27 @@ class CameraParameterWindow(QWidget):
             # Get all current parameters as a dictionary
             default_params = self.config.get_dict()
 
-            # Save current balance ratio selector to restore later
-            current_selector = self.balance_selector_combo.currentText()
+            # Current balance ratio selector (just loaded), restored at the end
+            current_selector = self.config.get_value("BalanceRatioSelector") or self.balance_selector_combo.currentText()
 
-            # Read balance ratios for all three channels
+            # Read balance ratios for all three channels; the selected channel's
+            # ratio was loaded above, so only the other channels need a selector switch
             balance_ratios = {}
+            if current_selector in ("Red", "Green", "Blue"):
+                balance_ratios[current_selector] = self.config.balance_ratio.value
+            selector = current_selector
             for channel in ["Red", "Green", "Blue"]:
+                if channel in balance_ratios:
+                    continue
                 # Set the selector to the channel
                 ret = self.camera.IMV_SetEnumFeatureSymbol("BalanceRatioSelector", channel)
-                if ret == IMV_OK:
+                if ret == IMV.IMV_OK:
+                    selector = channel
                     # Read the balance ratio for this channel
-                    channel_ratio = c_double(0)
+                    channel_ratio = self._scratch_double
+                    channel_ratio.value = 0.0
                     ret = self.camera.IMV_GetDoubleFeatureValue("BalanceRatio", channel_ratio)
-                    if ret == IMV_OK:
+                    if ret == IMV.IMV_OK:
                         balance_ratios[channel] = channel_ratio.value
                         self.logger.info(f"Read BalanceRatio for {channel}: {channel_ratio.value}")
                     else:
@@ -1540,7 +2637,8 @@ class CameraParameterWindow(QWidget):
                     self.logger.error(f"Failed to set BalanceRatioSelector to {channel}. Error code: {ret}")
 
             # Restore original selector
-            self.camera.IMV_SetEnumFeatureSymbol("BalanceRatioSelector", current_selector)
+            if selector != current_selector:
+                self.camera.IMV_SetEnumFeatureSymbol("BalanceRatioSelector", current_selector)
 
             # Replace single balance_ratio with channel-specific ratios
             if balance_ratios:
@@ -1551,18 +2649,17 @@ class CameraParameterWindow(QWidget):
                 default_params.pop('balance_ratio', None)
 
             # Define default config file path
-            config_file = "camera_default_config.json"
+            config_file = DEFAULT_CONFIG_FILE
 
             # Save parameters to JSON file
-            with open(config_file, 'w') as f:
-                json.dump(default_params, f, indent=4)
+            if save_default_config(default_params, config_file):
+                self.logger.info(f"Successfully saved default configuration to {config_file}")
+            else:
+                self.logger.info(f"Default configuration in {config_file} is unchanged, skipped writing")
 
-            self.logger.info(f"Successfully saved default configuration to {config_file}")
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Current parameters have been saved as default configuration!\n\nFile: {config_file}"
-            )
+            # The device file also holds the features the JSON file does not cover
+            self._save_device_defaults()
+            self.show_status(f"Current parameters have been saved as default configuration ({config_file})")
 
         except Exception as e:
             self.logger.error(f"Failed to save default configuration: {e}")
@@ -1575,10 +2672,9 @@ class CameraParameterWindow(QWidget):
             return
 
         if self.is_grabbing:
-            # Currently grabbing, so pause it
-            self.pause_grabbing()
-            # After pausing, check parameter editability and update UI
-            self.update_parameter_editability()
+            # Currently grabbing, so pause it without waiting for the worker;
+            # editability is checked in _on_worker_stopped() once it has stopped
+            self.pause_grabbing(wait=False)
         else:
             # Currently paused, so resume it
             self.resume_grabbing()
@@ -1586,7 +2682,14 @@ class CameraParameterWindow(QWidget):
             self.update_parameter_editability()
 
     def update_parameter_editability(self):
-        """Check editability for each parameter and enable/disable controls accordingly."""
+        """
+        Check editability for each parameter and enable/disable controls accordingly.
+
+        Editability only changes with the stream state and the modes below, so
+        the result is cached per combination of them and reused without
+        querying the camera. "Once" modes fall back to Off on the camera by
+        themselves, so they are always queried.
+        """
         try:
             # Map parameter names to their corresponding UI controls
             param_control_map = {
@@ -1602,81 +2705,127 @@ class CameraParameterWindow(QWidget):
                 "BalanceRatio": self.balance_ratio_spinbox
             }
 
+            key = (
+                self.is_grabbing,
+                self.exposure_mode_combo.currentText(),
+                self.balance_auto_combo.currentText(),
+                self.pixel_format_combo.currentText(),
+            )
+            cached = self._editability_cache.get(key)
+            if cached is not None:
+                self.editability_map.update(cached)
+                for param_name, control in param_control_map.items():
+                    control.setEnabled(cached[param_name])
+                return
+
             # Check editability for each parameter and update controls
-            for param_name, control in param_control_map.items():
-                is_editable = self.config.get_editability(self.camera, param_name)
-                control.setEnabled(is_editable)
+            with _log_duration(self.logger, "editability queries"):
+                for param_name, control in param_control_map.items():
+                    is_editable = self.config.get_editability(self.camera, param_name)
+                    self.editability_map[param_name] = is_editable
+                    control.setEnabled(is_editable)
 
-                # Log the editability status
-                status = "editable" if is_editable else "not editable"
-                self.logger.info(f"Parameter '{param_name}' is {status}")
+                    # Log the editability status
+                    status = "editable" if is_editable else "not editable"
+                    self.logger.info(f"Parameter '{param_name}' is {status}")
+
+            if "Once" not in key:
+                self._editability_cache[key] = dict(self.editability_map)
 
         except Exception as e:
             self.logger.error(f"Failed to update parameter editability: {e}")
             QMessageBox.warning(self, "Error", f"Failed to check parameter editability: {str(e)}")
 
 
-    def pause_grabbing(self):
-        """Pause the stream grabbing."""
+    def set_toggle_paused(self, paused):
+        """
+        Switch the pause/resume button style (see APP_STYLESHEET).
+
+        Args:
+            paused: True if the stream is paused
+        """
+        self.toggle_grab_btn.setProperty("paused", paused)
+        style = self.toggle_grab_btn.style()
+        style.unpolish(self.toggle_grab_btn)
+        style.polish(self.toggle_grab_btn)
+
+    def pause_grabbing(self, wait=True):
+        """
+        Pause the stream grabbing.
+
+        Args:
+            wait: Block until the worker has stopped grabbing, as needed before
+                writing stream-dependent parameters. Otherwise the toggle button
+                stays disabled until _on_worker_stopped().
+        """
         try:
             if self.worker is not None:
-                # Temporarily disconnect signals to stop processing
-                self.worker.image_signal.disconnect()
-                self.worker.result_signal.disconnect()
-                self.worker.error_signal.disconnect()
-                self.worker.status_signal.disconnect()
+                # Stop refreshing the preview; the worker signals stay connected
+                # for the whole connection, its stop and cleanup are logged
+                if self.parent_window is not None:
+                    self.parent_window.stop_preview_refresh()
 
                 # Stop the worker thread
                 self.worker.stop()
-                self.worker.wait(1000)
+                if wait:
+                    self._wait_worker_stopped()
+                else:
+                    self.toggle_grab_btn.setEnabled(False)
 
                 # Update state
                 self.is_grabbing = False
                 self.toggle_grab_btn.setText("Resume Stream")
-                self.toggle_grab_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #27ae60;
-                        color: white;
-                        font-weight: bold;
-                        padding: 8px;
-                    }
-                    QPushButton:hover {
-                        background-color: #229954;
-                    }
-                """)
+                self.set_toggle_paused(True)
+
+                self.update_refresh_timer()
 
                 logging.info("Stream grabbing paused")
         except Exception as e:
             logging.error(f"Failed to pause grabbing: {e}")
             QMessageBox.warning(self, "Error", f"Failed to pause stream: {str(e)}")
 
+    def _wait_worker_stopped(self):
+        """
+        Wait a bounded time for the worker thread to exit.
+
+        A timeout (e.g. IMV_StopGrabbing blocked on a dropped GigE link) is
+        logged and reported instead of hanging the GUI.
+
+        Returns:
+            bool: True if the worker has stopped
+        """
+        if self.worker.wait(_WORKER_STOP_TIMEOUT_MS):
+            return True
+        message = f"WARNING: Worker thread did not stop within {_WORKER_STOP_TIMEOUT_MS} ms"
+        self.logger.warning(message)
+        if self.parent_window is not None:
+            self.parent_window.log_message(logging.WARNING, message)
+        return False
+
+    def _on_worker_stopped(self):
+        """Finish a non-blocking pause once the worker thread has exited."""
+        if self.is_grabbing:
+            return
+        self.toggle_grab_btn.setEnabled(True)
+        self.update_parameter_editability()
+
     def resume_grabbing(self):
         """Resume the stream grabbing."""
         try:
             if self.worker is not None and self.parent_window is not None:
-                # Reconnect signals to parent window slots
-                self.worker.image_signal.connect(self.parent_window.update_video_display)
-                self.worker.result_signal.connect(self.parent_window.update_recognition_results)
-                self.worker.error_signal.connect(self.parent_window.handle_worker_error)
-                self.worker.status_signal.connect(self.parent_window.log_message)
-
-                # Restart the worker thread
+                # Restart the worker thread (start() is a no-op while it is still stopping)
+                if self.worker.isRunning() and not self._wait_worker_stopped():
+                    QMessageBox.warning(self, "Warning", "The stream is still stopping, please try to resume it again.")
+                    return
                 self.worker.start()
+                self.parent_window.start_preview_refresh()
 
                 # Update state
                 self.is_grabbing = True
                 self.toggle_grab_btn.setText("Pause Stream")
-                self.toggle_grab_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #f39c12;
-                        color: white;
-                        font-weight: bold;
-                        padding: 8px;
-                    }
-                    QPushButton:hover {
-                        background-color: #e67e22;
-                    }
-                """)
+                self.set_toggle_paused(False)
+
+                self.update_refresh_timer()
 
                 logging.info("Stream grabbing resumed")
             else:
@@ -1690,38 +2839,61 @@ class CameraParameterWindow(QWidget):
         If ExposureAuto == Continuous, refresh exposure time every 10 seconds;
         if BalanceWhiteAuto == Continuous, refresh balance ratio every 10 seconds
         """
+        if not self.is_grabbing:
+            return  # Values do not change while the stream is paused
+
         try:
             # Check if ExposureAuto is in Continuous mode
             if self.exposure_mode_combo.currentText() == "Continuous":
                 # Reload exposure time from camera
-                ret = self.camera.IMV_GetDoubleFeatureValue("ExposureTime", self.config.exposure_time)
-                if ret == IMV_OK:
-                    # Update UI with new value
-                    self.exposure_spinbox.blockSignals(True)
-                    self.exposure_spinbox.setValue(self.config.exposure_time.value)
-                    self.exposure_spinbox.blockSignals(False)
+                if self._refresh_spinbox("ExposureTime", self.config.exposure_time, self.exposure_spinbox):
                     self.logger.info(f"Refreshed ExposureTime: {self.config.exposure_time.value} μs")
-                else:
-                    self.logger.error(f"Failed to refresh ExposureTime. Error code: {ret}")
 
             # Check if BalanceWhiteAuto is in Continuous mode
             if self.balance_auto_combo.currentText() == "Continuous":
                 # Reload balance ratio from camera for currently selected channel
-                ret = self.camera.IMV_GetDoubleFeatureValue("BalanceRatio", self.config.balance_ratio)
-                if ret == IMV_OK:
-                    # Update UI with new value
-                    self.balance_ratio_spinbox.blockSignals(True)
-                    self.balance_ratio_spinbox.setValue(self.config.balance_ratio.value)
-                    self.balance_ratio_spinbox.blockSignals(False)
+                if self._refresh_spinbox("BalanceRatio", self.config.balance_ratio, self.balance_ratio_spinbox):
                     current_channel = self.balance_selector_combo.currentText()
                     self.logger.info(f"Refreshed BalanceRatio for {current_channel}: {self.config.balance_ratio.value}")
-                else:
-                    self.logger.error(f"Failed to refresh BalanceRatio. Error code: {ret}")
 
         except Exception as e:
             self.logger.error(f"Error in fresh_if_continuous: {e}")
 
+    def _refresh_spinbox(self, feature, value, spinbox):
+        """
+        Reload a double feature set by an auto mode and show it in its spinbox.
+
+        Once the auto mode has settled the value rarely moves by more than the
+        spinbox displays, so the spinbox is only updated on a visible change.
+
+        Args:
+            feature: Feature name, e.g. "ExposureTime"
+            value: c_double in the config that receives the value
+            spinbox: QDoubleSpinBox showing the feature
+
+        Returns:
+            bool: True if the spinbox was updated
+        """
+        ret = self.camera.IMV_GetDoubleFeatureValue(feature, value)
+        if ret != IMV.IMV_OK:
+            self.logger.error(f"Failed to refresh {feature}. Error code: {ret}")
+            return False
+
+        self.config.dirty.pop(feature, None)
+        if abs(value.value - spinbox.value()) < 0.5 * 10 ** -spinbox.decimals():
+            return False
+
+        # Update UI with new value
+        with QSignalBlocker(spinbox):
+            spinbox.setValue(value.value)
+        return True
+
     def closeEvent(self, event):
+        self.refresh_timer.stop()
+        try:
+            self.worker.finished.disconnect(self._on_worker_stopped)
+        except (RuntimeError, TypeError):
+            pass
         if not self.is_grabbing:
             self.resume_grabbing()
         else:
@@ -1735,6 +2907,7 @@ def main():
 
     # Set application style
     app.setStyle("Fusion")
+    app.setStyleSheet(APP_STYLESHEET)
 
     # Create and show main window
     window = CameraControlApp()
@@ -41,6 +41,25 @@ if not logger.handlers:
 
 logger.info(f"Camera config module loaded at {__name__}")
 
+# Float features whose min/max bound a control in the parameter window
+RANGE_FEATURES = ("ExposureTime", "GainRaw", "Gamma", "AcquisitionFrameRate", "BalanceRatio")
+
+# Features loaded from the camera: (feature name, type, attribute alias).
+# Values live in the doubles/enums/strings dicts; the attributes refer to the
+# same ctypes objects for existing callers.
+FEATURES = (
+    ("ExposureTime", "double", "exposure_time"),
+    ("ExposureAuto", "enum", "exposure_mode"),
+    ("GainRaw", "double", "raw_gain"),
+    ("Gamma", "double", "gamma"),
+    ("AcquisitionFrameRate", "double", "frame_rate"),
+    ("GevCurrentIPAddress", "string", "ip_address"),
+    ("PixelFormat", "enum", "pixel_format"),
+    ("BalanceWhiteAuto", "enum", "balance_auto"),
+    ("BalanceRatioSelector", "enum", "balance_ratio_selector"),
+    ("BalanceRatio", "double", "balance_ratio"),
+)
+
 
 class CameraConfig:
     """
@@ -67,26 +86,41 @@ class CameraConfig:
         # Create MvCamera instance for IMV_String types
         self._camera_handle = MvCamera()
 
-        # --- Camera Parameters ---
-        self.exposure_time = c_double(0)
-        self.exposure_mode = IMV_String()
-        self.raw_gain = c_double(0)
-        self.gamma = c_double(0)
-        self.frame_rate = c_double(0)
-        self.ip_address = IMV_String()
-        self.pixel_format = IMV_String()
-        self.balance_auto = IMV_String()
-        self.balance_ratio_selector = IMV_String()
-        self.balance_ratio = c_double(0)
+        # --- Camera Parameters (feature name -> ctypes value, by type) ---
+        self.doubles = {}
+        self.enums = {}
+        self.strings = {}
+        self.texts = {}  # Decoded enum/string values, refreshed by load_from_camera
+        for feature, feature_type, attr in FEATURES:
+            if feature_type == "double":
+                value = self.doubles[feature] = c_double(0)
+            elif feature_type == "enum":
+                value = self.enums[feature] = IMV_String()
+            else:
+                value = self.strings[feature] = IMV_String()
+            setattr(self, attr, value)
+
+        # --- Feature ranges (feature name -> (min, max)), cached per device ---
+        self.ranges = {}
+        self._ranges_key = None
+
+        # --- Editability snapshots (state key -> {feature: bool}), cached per device ---
+        self._editability_cache = {}
+        self._editability_key = None
+
+        # --- Edited values not yet written to the camera (feature name -> value) ---
+        self.dirty = {}
 
         self._initialized = True
 
-    def load_from_camera(self, camera):
+    def load_from_camera(self, camera, device_key=None):
         """
         Load parameter values from a connected camera.
 
         Args:
             camera: MvCamera instance (already opened and connected)
+            device_key: Identifier of the connected device (e.g. serial number),
+                        used to reuse cached feature ranges
 
         Returns:
             bool: True if all parameters loaded successfully, False otherwise
@@ -94,128 +128,194 @@ class CameraConfig:
         logger.info("Starting to load parameters from camera...")
         success = True
 
-        # Load exposure time
-        logger.debug("Checking ExposureTime readability...")
-        rel = camera.IMV_FeatureIsReadable("ExposureTime")
-        if rel == True:
-            ret = camera.IMV_GetDoubleFeatureValue("ExposureTime", self.exposure_time)
-            logger.debug(f"Exposure time: {self.exposure_time.value}")
-            if ret != IMV_OK:
-                logger.error(f"Get ExposureTime failed! ErrorCode: {ret}")
-                success = False
-        else:
-            logger.warning(f"ExposureTime is not readable.ErrorCode: {rel}")
-
-        # Load exposure mode
-        logger.debug("Checking ExposureAuto readability...")
-        rel = camera.IMV_FeatureIsReadable("ExposureAuto")
-        if rel == True:
-            ret = camera.IMV_GetEnumFeatureSymbol("ExposureAuto", self.exposure_mode)
-            logger.debug(f"Exposure mode: {self.exposure_mode.str.decode('utf-8') if self.exposure_mode.str else 'None'}")
-            if ret != IMV_OK:
-                logger.error(f"Get ExposureAuto failed! ErrorCode: {ret}")
-                success = False
-        else:
-            logger.warning(f"ExposureAuto is not readable. ErrorCode: {rel}")
-
-        # Load gain
-        logger.debug("Checking GainRaw readability...")
-        rel = camera.IMV_FeatureIsReadable("GainRaw")
-        if rel == True:
-            ret = camera.IMV_GetDoubleFeatureValue("GainRaw", self.raw_gain)
-            logger.debug(f"Raw Gain: {self.raw_gain.value}")
-            if ret != IMV_OK:
-                logger.error(f"Get GainRaw failed! ErrorCode: {ret}")
-                success = False
-        else:
-            logger.warning(f"GainRaw is not readable. ErrorCode: {rel}")
-
-        # Load gamma
-        logger.debug("Checking Gamma readability...")
-        rel = camera.IMV_FeatureIsReadable("Gamma")
-        if rel == True:
-            ret = camera.IMV_GetDoubleFeatureValue("Gamma", self.gamma)
-            logger.debug(f"Gamma: {self.gamma.value}")
+        # Feature ranges only change with the device or its pixel format
+        self.load_ranges(camera, device_key)
+
+        for feature, feature_type, _ in FEATURES:
+            logger.debug(f"Checking {feature} readability...")
+            rel = camera.IMV_FeatureIsReadable(feature)
+            if rel != True:
+                logger.warning(f"{feature} is not readable. ErrorCode: {rel}")
+                continue
+
+            if feature_type == "double":
+                value = self.doubles[feature]
+                ret = camera.IMV_GetDoubleFeatureValue(feature, value)
+                logger.debug(f"{feature}: {value.value}")
+            else:
+                if feature_type == "enum":
+                    value = self.enums[feature]
+                    ret = camera.IMV_GetEnumFeatureSymbol(feature, value)
+                else:
+                    value = self.strings[feature]
+                    ret = camera.IMV_GetStringFeatureValue(feature, value)
+                # Decode once here, readers use the cached text
+                self.texts[feature] = value.str.decode('utf-8') if value.str else ''
+                logger.debug(f"{feature}: {self.texts[feature] or 'None'}")
             if ret != IMV_OK:
-                logger.error(f"Get Gamma failed! ErrorCode: {ret}")
+                logger.error(f"Get {feature} failed! ErrorCode: {ret}")
                 success = False
-        else:
-            logger.warning(f"Gamma is not readable. ErrorCode: {rel}")
-
-        # Load frame rate
-        logger.debug("Checking AcquisitionFrameRate readability...")
-        rel = camera.IMV_FeatureIsReadable("AcquisitionFrameRate")
-        if rel == True:
-            ret = camera.IMV_GetDoubleFeatureValue("AcquisitionFrameRate", self.frame_rate)
-            logger.debug(f"Acquisition Frame Rate: {self.frame_rate.value}")
-            if ret != IMV_OK:
-                logger.error(f"Get AcquisitionFrameRate failed! ErrorCode: {ret}")
-                success = False
-        else:
-            logger.warning(f"AcquisitionFrameRate is not readable. ErrorCode: {rel}")
-
-        # Load IP address
-        logger.debug("Checking GevCurrentIPAddress readability...")
-        rel = camera.IMV_FeatureIsReadable("GevCurrentIPAddress")
-        if rel == True:
-            ret = camera.IMV_GetStringFeatureValue("GevCurrentIPAddress", self.ip_address)
-            logger.debug(f"Gev Current IP Address: {self.ip_address.str.decode('utf-8') if self.ip_address.str else 'None'}")
-            if ret != IMV_OK:
-                logger.error(f"Get GevCurrentIPAddress failed! ErrorCode: {ret}")
-                success = False
-        else:
-            logger.warning(f"GevCurrentIPAddress is not readable. ErrorCode: {rel}")
-
-        # Load pixel format
-        logger.debug("Checking PixelFormat readability...")
-        rel = camera.IMV_FeatureIsReadable("PixelFormat")
-        if rel == True:
-            ret = camera.IMV_GetEnumFeatureSymbol("PixelFormat", self.pixel_format)
-            logger.debug(f"Pixel format: {self.pixel_format.str.decode('utf-8') if self.pixel_format.str else 'None'}")
-            if ret != IMV_OK:
-                logger.error(f"Get PixelFormat failed! ErrorCode: {ret}")
-                success = False
-        else:
-            logger.warning(f"PixelFormat is not readable. ErrorCode: {rel}")
-
-        # Load white balance auto
-        logger.debug("Checking BalanceWhiteAuto readability...")
-        rel = camera.IMV_FeatureIsReadable("BalanceWhiteAuto")
-        if rel == True:
-            ret = camera.IMV_GetEnumFeatureSymbol("BalanceWhiteAuto", self.balance_auto)
-            logger.debug(f"Balance White Auto: {self.balance_auto.str.decode('utf-8') if self.balance_auto.str else 'None'}")
+
+        logger.info(f"Finished loading parameters. Success: {success}")
+        return success
+
+    def load_ranges(self, camera, device_key=None):
+        """
+        Read the min/max of every feature in RANGE_FEATURES in a single pass.
+
+        The ranges are kept until the device changes or invalidate_ranges()
+        is called, so reopening the parameter window does not query them again.
+
+        Args:
+            camera: MvCamera instance (already opened and connected)
+            device_key: Identifier of the connected device; None reuses the
+                        current cache whatever device it was read from
+
+        Returns:
+            dict: Feature name -> (min, max)
+        """
+        if self.ranges and (device_key is None or device_key == self._ranges_key):
+            return self.ranges
+
+        ranges = {}
+        min_value = c_double(0)  # Out-params reused for every feature
+        max_value = c_double(0)
+        for feature in RANGE_FEATURES:
+            min_value.value = max_value.value = 0.0
+            ret = camera.IMV_GetDoubleFeatureMin(feature, min_value)
             if ret != IMV_OK:
-                logger.error(f"Get BalanceWhiteAuto failed! ErrorCode: {ret}")
-                success = False
-        else:
-            logger.warning(f"BalanceWhiteAuto is not readable. ErrorCode: {rel}")
-
-        # Load balance ratio selector
-        logger.debug("Checking BalanceRatioSelector readability...")
-        rel = camera.IMV_FeatureIsReadable("BalanceRatioSelector")
-        if rel == True:
-            ret = camera.IMV_GetEnumFeatureSymbol("BalanceRatioSelector", self.balance_ratio_selector)
-            logger.debug(f"Balance Ratio Selector: {self.balance_ratio_selector.str.decode('utf-8') if self.balance_ratio_selector.str else 'None'}")
+                logger.error(f"Get {feature} min failed! ErrorCode: {ret}")
+            ret = camera.IMV_GetDoubleFeatureMax(feature, max_value)
             if ret != IMV_OK:
-                logger.error(f"Get BalanceRatioSelector failed! ErrorCode: {ret}")
-                success = False
+                logger.error(f"Get {feature} max failed! ErrorCode: {ret}")
+            ranges[feature] = (min_value.value, max_value.value)
+            logger.debug(f"{feature} range: {ranges[feature]}")
+
+        self.ranges = ranges
+        self._ranges_key = device_key
+        return self.ranges
+
+    def refresh_range(self, camera, feature):
+        """
+        Re-read the min/max of one feature and update the cached ranges.
+
+        Used after a write that moves the limits of another feature, so the
+        rest of the cache stays valid.
+
+        Args:
+            camera: MvCamera instance (already opened and connected)
+            feature: Feature name from RANGE_FEATURES
+
+        Returns:
+            tuple: (min, max), or None if the range could not be read
+        """
+        min_value = c_double(0)
+        max_value = c_double(0)
+        ret = camera.IMV_GetDoubleFeatureMin(feature, min_value)
+        if ret == IMV_OK:
+            ret = camera.IMV_GetDoubleFeatureMax(feature, max_value)
+        if ret != IMV_OK:
+            logger.error(f"Refresh {feature} range failed! ErrorCode: {ret}")
+            self.invalidate_ranges()  # Re-read everything when the window is opened next
+            return None
+
+        if self.ranges:
+            self.ranges[feature] = (min_value.value, max_value.value)
+        logger.debug(f"{feature} range: {(min_value.value, max_value.value)}")
+        return (min_value.value, max_value.value)
+
+    def invalidate_ranges(self):
+        """Drop the cached feature ranges (e.g. after a pixel format change)."""
+        self.ranges = {}
+
+    def clear_device_cache(self):
+        """Drop all cached device metadata (ranges and editability), e.g. on disconnect."""
+        self.ranges = {}
+        self._ranges_key = None
+        self._editability_cache = {}
+        self._editability_key = None
+
+    def editability_cache(self, device_key):
+        """
+        Get the editability snapshots of a device, kept across parameter windows.
+
+        Editability only depends on the device, its stream state and modes, so
+        the snapshots stay valid until the device is disconnected (see
+        clear_device_cache()).
+
+        Args:
+            device_key: Identifier of the connected device; None gives a
+                        cache that is not kept
+
+        Returns:
+            dict: State key -> {feature name: editable}, filled by the caller
+        """
+        if device_key is None:
+            return {}
+        if device_key != self._editability_key:
+            self._editability_cache = {}
+            self._editability_key = device_key
+        return self._editability_cache
+
+    def get_range(self, feature):
+        """
+        Get the cached range of a feature.
+
+        Args:
+            feature: Feature name from RANGE_FEATURES
+
+        Returns:
+            tuple: (min, max), or (0.0, 0.0) if the range was not loaded
+        """
+        return self.ranges.get(feature, (0.0, 0.0))
+
+    def get_value(self, feature):
+        """
+        Get the last loaded or applied value of a feature.
+
+        Args:
+            feature: Feature name
+
+        Returns:
+            The value (float or str), or None for features that are not tracked
+        """
+        if feature in self.doubles:
+            return self.doubles[feature].value
+        if feature in self.enums or feature in self.strings:
+            return self.texts.get(feature, '')
+        return None
+
+    def store_value(self, feature, value):
+        """
+        Record a value that was written to the camera and clear its dirty entry.
+
+        Args:
+            feature: Feature name
+            value: Value that was applied
+        """
+        if feature in self.doubles:
+            self.doubles[feature].value = value
+        elif feature in self.enums or feature in self.strings:
+            self.texts[feature] = str(value)
+        self.dirty.pop(feature, None)
+
+    def mark_dirty(self, feature, value):
+        """
+        Record an edited value, or drop it if it matches the camera value.
+
+        Args:
+            feature: Feature name
+            value: Edited value
+        """
+        current = self.get_value(feature)
+        if isinstance(value, float) and current is not None:
+            unchanged = abs(value - current) < 0.005  # Spinboxes show 2 decimals
         else:
-            logger.warning(f"BalanceRatioSelector is not readable. ErrorCode: {rel}")
-
-        # Load balance ratio
-        logger.debug("Checking BalanceRatio readability...")
-        rel = camera.IMV_FeatureIsReadable("BalanceRatio")
-        if rel == True:
-            ret = camera.IMV_GetDoubleFeatureValue("BalanceRatio", self.balance_ratio)
-            logger.debug(f"Balance Ratio: {self.balance_ratio.value}")
-            if ret != IMV_OK:
-                logger.error(f"Get BalanceRatio failed! ErrorCode: {ret}")
-                success = False
+            unchanged = value == current
+        if unchanged:
+            self.dirty.pop(feature, None)
         else:
-            logger.warning(f"BalanceRatio is not readable. ErrorCode: {rel}")
-
-        logger.info(f"Finished loading parameters. Success: {success}")
-        return success
+            self.dirty[feature] = value
 
     def get_dict(self):
         """
@@ -224,18 +324,7 @@ class CameraConfig:
         Returns:
             dict: All parameter values
         """
-        return {
-            'exposure_time': self.exposure_time.value,
-            'exposure_mode': self.exposure_mode.str.decode('utf-8') if self.exposure_mode.str else '',
-            'raw_gain': self.raw_gain.value,
-            'gamma': self.gamma.value,
-            'frame_rate': self.frame_rate.value,
-            'ip_address': self.ip_address.str.decode('utf-8') if self.ip_address.str else '',
-            'pixel_format': self.pixel_format.str.decode('utf-8') if self.pixel_format.str else '',
-            'balance_auto': self.balance_auto.str.decode('utf-8') if self.balance_auto.str else '',
-            'balance_ratio_selector': self.balance_ratio_selector.str.decode('utf-8') if self.balance_ratio_selector.str else '',
-            'balance_ratio': self.balance_ratio.value,
-        }
+        return {attr: self.get_value(feature) for feature, _, attr in FEATURES}
 
     def get_editability(self, camera, param_name=None):
         """
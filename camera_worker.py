@@ -23,8 +23,8 @@ import cv2
 import time
 import queue
 import threading
-from PySide6.QtCore import QThread, Signal
-from PySide6.QtGui import QImage
+from PySide6.QtCore import Qt, QThread, Signal, QMutex, QMutexLocker, QSize, QPoint
+from PySide6.QtGui import QImage, QPainter, QPen, QColor, QPolygon
 import logging
 
 from code_recognition import CodeRecognizer
@@ -35,26 +35,179 @@ sys.path.append("C:/Program Files/HuarayTech/MV Viewer/Development/Samples/Pytho
 from IMVApi import *
 
 
+# SDK pixel types -> (OpenCV demosaic code or None for mono, bit depth, packed).
+# OpenCV names Bayer patterns after the second row, so BayerRG maps to
+# COLOR_BayerBG2BGR etc. Edge-aware (_EA) demosaicing matches the quality of
+# the SDK's high quality interpolation and runs in OpenCV's SIMD kernels.
+_PIXEL_TYPES = {
+    getattr(IMV_EPixelType, name): (code, bits, False)
+    for name, code, bits in (
+        ("gvspPixelBayRG8", cv2.COLOR_BayerBG2BGR_EA, 8),
+        ("gvspPixelBayGB8", cv2.COLOR_BayerGR2BGR_EA, 8),
+        ("gvspPixelBayGR8", cv2.COLOR_BayerGB2BGR_EA, 8),
+        ("gvspPixelBayBG8", cv2.COLOR_BayerRG2BGR_EA, 8),
+        ("gvspPixelBayRG10", cv2.COLOR_BayerBG2BGR_EA, 10),
+        ("gvspPixelBayGB10", cv2.COLOR_BayerGR2BGR_EA, 10),
+        ("gvspPixelBayGR10", cv2.COLOR_BayerGB2BGR_EA, 10),
+        ("gvspPixelBayBG10", cv2.COLOR_BayerRG2BGR_EA, 10),
+        ("gvspPixelBayRG12", cv2.COLOR_BayerBG2BGR_EA, 12),
+        ("gvspPixelBayGB12", cv2.COLOR_BayerGR2BGR_EA, 12),
+        ("gvspPixelBayGR12", cv2.COLOR_BayerGB2BGR_EA, 12),
+        ("gvspPixelBayBG12", cv2.COLOR_BayerRG2BGR_EA, 12),
+        ("gvspPixelMono10", None, 10),
+        ("gvspPixelMono12", None, 12),
+    )
+    if hasattr(IMV_EPixelType, name)
+}
+# GigE packed formats store two pixels in three bytes; the first and third
+# byte hold the 8 most significant bits of each pixel.
+_PIXEL_TYPES.update({
+    getattr(IMV_EPixelType, name): (code, bits, True)
+    for name, code, bits in (
+        ("gvspPixelBayRG10Packed", cv2.COLOR_BayerBG2BGR_EA, 10),
+        ("gvspPixelBayGB10Packed", cv2.COLOR_BayerGR2BGR_EA, 10),
+        ("gvspPixelBayGR10Packed", cv2.COLOR_BayerGB2BGR_EA, 10),
+        ("gvspPixelBayBG10Packed", cv2.COLOR_BayerRG2BGR_EA, 10),
+        ("gvspPixelBayRG12Packed", cv2.COLOR_BayerBG2BGR_EA, 12),
+        ("gvspPixelBayGB12Packed", cv2.COLOR_BayerGR2BGR_EA, 12),
+        ("gvspPixelBayGR12Packed", cv2.COLOR_BayerGB2BGR_EA, 12),
+        ("gvspPixelBayBG12Packed", cv2.COLOR_BayerRG2BGR_EA, 12),
+        ("gvspPixelMono10Packed", None, 10),
+        ("gvspPixelMono12Packed", None, 12),
+    )
+    if hasattr(IMV_EPixelType, name)
+})
+
+
+def frame_to_image(frame):
+    """
+    Copy an SDK frame into an OpenCV image (BGR, or grayscale for mono formats).
+
+    Demosaicing runs in OpenCV's vectorized kernels; 10/12-bit data is
+    reduced to 8 bits for JPEG (packed formats by keeping their high byte).
+    The result owns its data, so the frame can be released right after this
+    call.
+
+    Args:
+        frame: IMV_Frame (not yet released)
+
+    Returns:
+        numpy array, or None if the pixel format is not handled here
+    """
+    info = frame.frameInfo
+    width, height, pixel_format = int(info.width), int(info.height), info.pixelFormat
+    raw = np.ctypeslib.as_array((c_ubyte * info.size).from_address(frame.pData))
+
+    if pixel_format == IMV_EPixelType.gvspPixelMono8 and raw.size == width * height:
+        return raw.reshape((height, width)).copy()
+    if pixel_format == IMV_EPixelType.gvspPixelBGR8 and raw.size == width * height * 3:
+        return raw.reshape((height, width, 3)).copy()
+    if pixel_format not in _PIXEL_TYPES:
+        return None
+
+    code, bits, packed = _PIXEL_TYPES[pixel_format]
+    if packed:
+        # Keep the most significant byte of each pixel: already 8 bits
+        if width % 2 or raw.size != width * height * 3 // 2:
+            return None
+        image = raw.reshape((height, width // 2, 3))[:, :, 0::2].reshape((height, width))  # Copies
+        bits = 8
+    elif bits == 8:
+        if raw.size != width * height:
+            return None
+        image = raw.reshape((height, width))
+    else:
+        # Unpacked high bit depth: one little-endian uint16 per pixel
+        if raw.size != width * height * 2:
+            return None
+        image = raw.view(np.uint16).reshape((height, width))
+
+    if code is not None:
+        image = cv2.cvtColor(image, code)  # Allocates the result
+    if bits > 8:
+        image = cv2.convertScaleAbs(image, alpha=1.0 / (1 << (bits - 8)))  # Allocates the result
+    return image
+
+
+def image_to_qimage(image):
+    """
+    Wrap an OpenCV image (BGR, or grayscale) as a QImage without copying.
+
+    The QImage shares memory with image, which must stay alive while it is used.
+
+    Args:
+        image: C-contiguous BGR or grayscale numpy array
+
+    Returns:
+        QImage object
+    """
+    height, width = image.shape[:2]
+    image_format = QImage.Format.Format_Grayscale8 if image.ndim == 2 else QImage.Format.Format_BGR888
+    return QImage(image.data, width, height, image.strides[0], image_format)
+
+
+def downsample_for_preview(image, width, height):
+    """
+    Reduce an OpenCV image by an integer stride for display.
+
+    The stride is chosen so the result still covers width x height, leaving
+    the final (smooth) scaling to Qt on a much smaller image. Only the kept
+    pixels are copied.
+
+    Args:
+        image: BGR or grayscale numpy array
+        width: Target display width
+        height: Target display height
+
+    Returns:
+        numpy.ndarray: The reduced image, or image itself if it is not at least
+        twice the target size
+    """
+    step = int(min(image.shape[1] / max(width, 1), image.shape[0] / max(height, 1)))
+    if step < 2:
+        return image
+    return np.ascontiguousarray(image[::step, ::step])
+
+
+def save_jpeg(image, path, quality=90):
+    """
+    Encode an OpenCV image as JPEG (libjpeg-turbo bundled with OpenCV) and write it.
+
+    Args:
+        image: BGR or grayscale numpy array
+        path: Target file path (may contain non-ASCII characters)
+        quality: JPEG quality (0-100)
+
+    Returns:
+        bool: True if the file was written
+    """
+    ok, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        return False
+    encoded.tofile(path)
+    return True
+
+
 class CameraWorker(QThread):
     """
     Worker thread for camera operations and image processing.
 
+    Display frames are not signalled; the UI pulls the latest one, already
+    annotated with detection boxes, with take_display_frame() once per
+    display refresh.
+
     Signals:
-        image_signal: Emits QImage for video display
         result_signal: Emits decoded QR/Barcode text
         error_signal: Emits error messages
-        status_signal: Emits status messages for logging
+        status_signal: Emits (logging level, message) status messages
         fps_signal: Emits FPS (frames per second) value
-        detection_signal: Emits detection results with position info
     """
 
     # Define signals for thread-safe communication
-    image_signal = Signal(QImage)
     result_signal = Signal(str)
     error_signal = Signal(str)
-    status_signal = Signal(str)
+    status_signal = Signal(int, str)  # (logging level, message)
     fps_signal = Signal(float)
-    detection_signal = Signal(list)  # Emits list of detections with positions
     temperature_signal = Signal(float)  # Emits device temperature in Celsius
 
     def __init__(self, camera):
@@ -78,6 +231,7 @@ class CameraWorker(QThread):
             self.logger.addHandler(file_handler)
         self.camera = camera
         self.running = False
+        self._stop_event = threading.Event()  # Wakes run() as soon as stop() is called
         self.recognizer = CodeRecognizer()
         self.storage = CodeStorage()
 
@@ -89,11 +243,39 @@ class CameraWorker(QThread):
         # Frame skip counter for recognition optimization
         self.frame_count = 0
         self.recognition_interval = 10  # Process every 10th frame for async recognition
+        self.recognition_max_edge = 1024  # Long edge of the image handed to the detectors (0 = full resolution)
 
         # Display frame skip counter for UI optimization
         self.display_count = 0
         self.display_interval = 1  # Emit every frame for maximum smoothness with callback
 
+        # Display frame: the callback converts, scales and annotates each frame
+        # at the preview size, then publishes it under the mutex. The UI thread
+        # takes the latest published frame.
+        self.display_mutex = QMutex()
+        self.display_size = QSize()  # Preview widget size, set by UI thread
+        self._src_size = QSize()  # Sensor image size of the last frame
+        self._display_target = None  # Cached aspect-fit size of _src_size in display_size
+        self._front_frame = None  # QImage ready for display
+
+        # Detection boxes are painted onto each display frame here, so the UI
+        # thread only shows finished frames. The recognition thread replaces
+        # the detections (under display_mutex); the overlay is rendered once
+        # per new detection result and composited onto every frame.
+        self._detections = []
+        self._detections_dirty = False
+        self._overlay_cache = None
+        self._overlay_scale = 1.0
+        self._pen_qr = QPen(QColor(0, 255, 0))  # Green for QR codes
+        self._pen_qr.setWidth(12)
+        self._pen_barcode = QPen(QColor(255, 0, 0))  # Red for barcodes
+        self._pen_barcode.setWidth(12)
+
+        # Conversion buffer reused across frames (reallocated on size change).
+        # The RGB image built in it is only valid until the next callback;
+        # display and recognition take their own copies.
+        self._convert_buffer = None  # IMV_PixelConvert destination
+
         # FPS calculation variables
         self.fps_frame_count = 0
         self.fps_start_time = time.time()
@@ -117,18 +299,22 @@ class CameraWorker(QThread):
         4. Wait until stopped
         5. Cleanup: Stop threads and camera
         """
+        self._stop_event.clear()
         self.running = True
+        with QMutexLocker(self.display_mutex):
+            self._detections = []  # No boxes from a previous run
+            self._detections_dirty = True
 
         try:
             # Step 1: Start async recognition thread
-            self.status_signal.emit("Starting recognition thread...")
+            self.status_signal.emit(logging.INFO, "Starting recognition thread...")
             self.recognition_running = True
             self.recognition_thread = threading.Thread(target=self._recognition_worker, daemon=True)
             self.recognition_thread.start()
             self.logger.info("Recognition thread started")
 
             # Step 2: Create and attach callback function
-            self.status_signal.emit("Attaching frame callback...")
+            self.status_signal.emit(logging.INFO, "Attaching frame callback...")
             pFrame = POINTER(IMV_Frame)
             FrameCallbackType = CFUNCTYPE(None, pFrame, c_void_p)
             self.callback_func = FrameCallbackType(self._frame_callback)
@@ -139,11 +325,11 @@ class CameraWorker(QThread):
                 self.logger.error(f"IMV_AttachGrabbing failed with code: {ret}")
                 return
 
-            self.status_signal.emit("Callback attached successfully")
+            self.status_signal.emit(logging.INFO, "Callback attached successfully")
             self.logger.info("Frame callback attached")
 
             # Step 3: Start grabbing frames
-            self.status_signal.emit("Starting frame acquisition...")
+            self.status_signal.emit(logging.INFO, "Starting frame acquisition...")
             ret = self.camera.IMV_StartGrabbing()
 
             if ret != IMV_OK:
@@ -151,12 +337,12 @@ class CameraWorker(QThread):
                 self.logger.error(f"IMV_StartGrabbing failed with code: {ret}")
                 return
 
-            self.status_signal.emit("Frame acquisition started successfully")
+            self.status_signal.emit(logging.INFO, "Frame acquisition started successfully")
             self.logger.info("Camera grabbing started (callback mode)")
 
             # Step 4: Wait until stopped (callback handles frames)
             while self.running:
-                self.msleep(100)  # Sleep to avoid busy waiting
+                self._stop_event.wait()  # Blocks without polling until stop()
 
         except Exception as e:
             self.error_signal.emit(f"Critical error in worker thread: {str(e)}")
@@ -183,28 +369,32 @@ class CameraWorker(QThread):
             # Get frame data
             frame = cast(pFrame, POINTER(IMV_Frame)).contents
 
-            # Convert to RGB format
-            rgb_image = self._convert_frame_to_rgb(frame)
-
-            if rgb_image is None:
-                return
-
-            # Emit for display (fast, no blocking)
-            self.frame_count += 1
-            self.display_count += 1
-
-            if self.display_count % self.display_interval == 0:
-                q_image = self._convert_to_qimage(rgb_image)
-                if q_image is not None:
-                    self.image_signal.emit(q_image)
-
-            # Queue for async recognition
-            if self.frame_count % self.recognition_interval == 0:
-                try:
-                    # Non-blocking put, discard if queue is full
-                    self.recognition_queue.put_nowait(rgb_image.copy())
-                except queue.Full:
-                    self.logger.debug("Recognition queue full, skipping frame")
+            # Mono8/BGR8 images are zero-copy views of the frame buffer, so the
+            # frame is only released after display and recognition took copies
+            try:
+                # Convert to RGB format
+                rgb_image = self._convert_frame_to_rgb(frame)
+
+                if rgb_image is None:
+                    return
+
+                # Emit for display (fast, no blocking)
+                self.frame_count += 1
+                self.display_count += 1
+
+                if self.display_count % self.display_interval == 0:
+                    self._render_display_frame(rgb_image)
+
+                # Queue for async recognition
+                if self.frame_count % self.recognition_interval == 0:
+                    try:
+                        # Non-blocking put, discard if queue is full
+                        self.recognition_queue.put_nowait(rgb_image.copy())
+                    except queue.Full:
+                        self.logger.debug("Recognition queue full, skipping frame")
+            finally:
+                # Release frame buffer (important!)
+                self.camera.IMV_ReleaseFrame(frame)
 
             # Calculate and emit FPS
             self.fps_frame_count += 1
@@ -225,6 +415,156 @@ class CameraWorker(QThread):
         except Exception as e:
             self.logger.error(f"Callback error: {str(e)}")
 
+    def set_display_size(self, size):
+        """
+        Set the preview target size (called from UI thread on resize).
+
+        Args:
+            size: QSize of the video display widget
+        """
+        with QMutexLocker(self.display_mutex):
+            self.display_size = QSize(size)
+            self._display_target = None  # Recompute aspect-fit size on next frame
+
+    def take_display_frame(self):
+        """
+        Take the latest display frame (called from UI thread).
+
+        Returns:
+            QImage: Display frame with detections drawn, or None if no new
+                    frame is available since the last call
+        """
+        with QMutexLocker(self.display_mutex):
+            frame = self._front_frame
+            self._front_frame = None
+            return frame
+
+    def _render_display_frame(self, rgb_image):
+        """
+        Convert, scale and annotate a frame, then publish it for display.
+
+        Runs in the camera SDK thread so the UI thread does no per-frame
+        conversion or scaling. The frame is resized with OpenCV before it is
+        wrapped, so only the display-sized image is copied into the QImage.
+
+        Args:
+            rgb_image: RGB or 2D grayscale image (numpy array)
+
+        Returns:
+            bool: True if a new display frame was published
+        """
+        display_buffer = self._display_buffer(rgb_image)
+        if display_buffer is None:
+            return False
+        buffer, image_format = display_buffer
+
+        # Aspect-fit target size only changes with sensor or widget size,
+        # so it is computed once and reused for every frame
+        src_size = QSize(buffer.shape[1], buffer.shape[0])
+        with QMutexLocker(self.display_mutex):
+            if self._display_target is None or src_size != self._src_size:
+                self._src_size = src_size
+                if self.display_size.isValid() and not self.display_size.isEmpty():
+                    self._display_target = src_size.scaled(self.display_size, Qt.AspectRatioMode.KeepAspectRatio)
+                else:
+                    self._display_target = src_size
+            target_size = self._display_target
+
+        if target_size != src_size:
+            # Nearest neighbour, as Qt's FastTransformation, but vectorized
+            buffer = cv2.resize(buffer, (target_size.width(), target_size.height()),
+                                interpolation=cv2.INTER_NEAREST)
+
+        # Detach from the frame (or resize) buffer before publishing
+        scaled_image = QImage(buffer.data, buffer.shape[1], buffer.shape[0],
+                              buffer.strides[0], image_format).copy()
+
+        scale = scaled_image.width() / src_size.width()
+        scaled_image = self._paint_detections(scaled_image, scale)
+
+        with QMutexLocker(self.display_mutex):
+            self._front_frame = scaled_image
+
+        return True
+
+    def _paint_detections(self, q_image, scale):
+        """
+        Composite the detection overlay onto a display frame.
+
+        The overlay is rendered only when new detections arrived or the frame
+        size changed; every other frame just composites it in place.
+
+        Args:
+            q_image: Display frame owned by this thread (modified in place)
+            scale: Ratio of q_image size to the sensor image size that
+                   detection points refer to
+
+        Returns:
+            QImage with detections drawn
+        """
+        with QMutexLocker(self.display_mutex):
+            detections = self._detections
+            if self._detections_dirty:
+                self._overlay_cache = None  # Re-render with the detections read above
+                self._detections_dirty = False
+        if not detections:
+            return q_image
+
+        # Mono cameras deliver Grayscale8 frames; colored boxes need RGB
+        if q_image.format() == QImage.Format.Format_Grayscale8:
+            q_image = q_image.convertToFormat(QImage.Format.Format_RGB888)
+
+        if (self._overlay_cache is None
+                or self._overlay_cache.size() != q_image.size()
+                or self._overlay_scale != scale):
+            self._overlay_cache = self._render_detection_overlay(q_image.size(), detections, scale)
+            self._overlay_scale = scale
+
+        painter = QPainter(q_image)
+        painter.drawImage(0, 0, self._overlay_cache)
+        painter.end()
+
+        return q_image
+
+    def _render_detection_overlay(self, size, detections, scale):
+        """
+        Render detection boxes into a transparent overlay.
+
+        Args:
+            size: Overlay size (QSize of the display frame)
+            detections: List of detection dicts
+            scale: Ratio of display frame size to sensor image size
+
+        Returns:
+            QImage (ARGB32 premultiplied) overlay
+        """
+        overlay = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+        overlay.fill(Qt.GlobalColor.transparent)
+
+        # Group the boxes by color, so the pen is set once per color;
+        # points is an np.int32 (n, 2) array, tolist() converts all vertices
+        # to Python ints in one call
+        polygons = {'QR': [], 'Barcode': []}
+        for detection in detections:
+            points = detection.get('points', None)
+            if points is None or len(points) == 0:
+                continue
+            group = 'QR' if detection.get('type', 'Unknown') == 'QR' else 'Barcode'
+            polygons[group].append(QPolygon([QPoint(x, y) for x, y in points.tolist()]))
+
+        # Aliased drawing: antialiasing a 12 px stroke costs far more and is
+        # not visible on the scaled-down preview
+        painter = QPainter(overlay)
+        painter.scale(scale, scale)  # Draw in sensor coordinates
+        for group, pen in (('QR', self._pen_qr), ('Barcode', self._pen_barcode)):
+            if polygons[group]:
+                painter.setPen(pen)
+                for polygon in polygons[group]:
+                    painter.drawPolygon(polygon)
+        painter.end()
+
+        return overlay
+
     def _recognition_worker(self):
         """
         Async recognition worker thread.
@@ -238,11 +578,36 @@ class CameraWorker(QThread):
                 # Wait for frame with timeout
                 rgb_image = self.recognition_queue.get(timeout=0.5)
 
-                # Convert RGB to BGR for recognition
-                bgr_image = rgb_image[:, :, ::-1]
+                # Frames queued while the previous one was decoded are stale,
+                # only the newest one is worth decoding
+                while True:
+                    try:
+                        rgb_image = self.recognition_queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                # One grayscale conversion shared by both detectors: wechat_qrcode
+                # converts to gray internally and pyzbar only accepts 8-bit single
+                # channel images (Mono8 frames are already grayscale)
+                if rgb_image.ndim == 2:
+                    gray_image = rgb_image
+                else:
+                    gray_image = cv2.cvtColor(rgb_image, cv2.COLOR_RGB2GRAY)
+
+                # Localize codes on a downscaled image; detection points are
+                # mapped back to sensor coordinates for the overlay
+                height, width = gray_image.shape
+                scale = 1.0
+                if self.recognition_max_edge > 0 and max(height, width) > self.recognition_max_edge:
+                    scale = self.recognition_max_edge / max(height, width)
+                    gray_image = cv2.resize(gray_image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
 
                 # Detect codes with positions
-                decoded_text, detections = self.recognizer.detect_codes_with_positions(bgr_image)
+                decoded_text, detections = self.recognizer.detect_codes_with_positions(gray_image)
+
+                if scale != 1.0:
+                    for detection in detections:
+                        detection['points'] = (detection['points'] / scale).astype(np.int32)
 
                 # Emit results and Store
                 if decoded_text:
@@ -259,7 +624,10 @@ class CameraWorker(QThread):
                     else:
                         self.logger.debug(f"Duplicate code recognized: {decoded_text}")
 
-                self.detection_signal.emit(detections) # Emit detections for display
+                # Picked up by the next display frame, see _paint_detections()
+                with QMutexLocker(self.display_mutex):
+                    self._detections = detections
+                    self._detections_dirty = True
 
             except queue.Empty:
                 continue
@@ -272,13 +640,15 @@ class CameraWorker(QThread):
         """
         Convert SDK frame to RGB format in callback.
 
-        Similar to _convert_to_opencv but optimized for callback use.
+        Similar to _convert_to_opencv but optimized for callback use. Mono8
+        and BGR8 results are views of the frame buffer; the caller releases
+        the frame once it is done with them.
 
         Args:
             frame_data: IMV_Frame object
 
         Returns:
-            numpy array (RGB image) or None
+            numpy array (RGB image, or 2D grayscale image for Mono8) or None
         """
         try:
             width = frame_data.frameInfo.width
@@ -290,7 +660,7 @@ class CameraWorker(QThread):
                 image_array = np.ctypeslib.as_array(
                     (c_ubyte * frame_data.frameInfo.size).from_address(frame_data.pData)
                 ).reshape((height, width))
-                rgb_image = cv2.cvtColor(image_array, cv2.COLOR_GRAY2RGB)
+                rgb_image = image_array  # Kept single channel: displayed as Grayscale8, recognized as is
 
             elif pixel_format == IMV_EPixelType.gvspPixelBGR8:
                 image_array = np.ctypeslib.as_array(
@@ -303,7 +673,9 @@ class CameraWorker(QThread):
                 stPixelConvertParams = IMV_PixelConvertParam()
                 dst_pixel = IMV_EPixelType.gvspPixelBGR8
                 dst_size = int(width) * int(height) * 3
-                dst_buffer = (c_ubyte * dst_size)()
+                if self._convert_buffer is None or len(self._convert_buffer) != dst_size:
+                    self._convert_buffer = (c_ubyte * dst_size)()
+                dst_buffer = self._convert_buffer
                 memset(byref(dst_buffer), 0, sizeof(stPixelConvertParams))
 
                 stPixelConvertParams.nWidth = c_uint(width)
@@ -329,9 +701,6 @@ class CameraWorker(QThread):
                 image_array = np.ctypeslib.as_array(dst_buffer).reshape((height, width, 3))
                 rgb_image = image_array[:, :, ::-1]  # BGR to RGB
 
-            # Release frame buffer (important!)
-            self.camera.IMV_ReleaseFrame(frame_data)
-
             return rgb_image
 
         except Exception as e:
@@ -455,34 +824,36 @@ class CameraWorker(QThread):
 #             self.status_signal.emit(f"Image conversion error: {str(e)}")
 #             return None
 
-    def _convert_to_qimage(self, rgb_image):
+    def _display_buffer(self, rgb_image):
         """
-        Convert RGB image to QImage for Qt display.
+        Get a C-contiguous buffer of an RGB image and its QImage format.
+
+        The buffer is rgb_image itself (or the packed BGR buffer it is a view
+        of) whenever possible, so no pixel data is copied.
 
         Args:
-            rgb_image: RGB image (numpy array)
+            rgb_image: RGB image, or 2D grayscale image for Mono8 (numpy array)
 
         Returns:
-            QImage object or None
+            tuple: (numpy array, QImage.Format) or None
         """
         try:
-            height, width, channels = rgb_image.shape
-            bytes_per_line = channels * width
-
-            # Image is already in RGB format, no conversion needed
-            # Use tobytes() to create independent data copy (faster than .copy())
-            q_image = QImage(
-                rgb_image.tobytes(),
-                width,
-                height,
-                bytes_per_line,
-                QImage.Format.Format_RGB888
-            )
+            if rgb_image.ndim == 2:
+                # Mono: 1 byte per pixel, no color expansion
+                buffer = rgb_image if rgb_image.flags['C_CONTIGUOUS'] else np.ascontiguousarray(rgb_image)
+                image_format = QImage.Format.Format_Grayscale8
+            elif rgb_image.flags['C_CONTIGUOUS']:
+                buffer, image_format = rgb_image, QImage.Format.Format_RGB888
+            elif rgb_image[:, :, ::-1].flags['C_CONTIGUOUS']:
+                # RGB view of a packed BGR buffer (fast BGR->RGB slicing), wrap the BGR buffer
+                buffer, image_format = rgb_image[:, :, ::-1], QImage.Format.Format_BGR888
+            else:
+                buffer, image_format = np.ascontiguousarray(rgb_image), QImage.Format.Format_RGB888
 
-            return q_image  # No need for .copy() as tobytes() already creates a copy
+            return buffer, image_format
 
         except Exception as e:
-            self.status_signal.emit(f"QImage conversion error: {str(e)}")
+            self.status_signal.emit(logging.ERROR, f"QImage conversion error: {str(e)}")
             return None
 
     def _check_temperature(self):
@@ -518,9 +889,10 @@ class CameraWorker(QThread):
         """
         Signal the worker thread to stop.
         """
-        self.status_signal.emit("Stop signal received")
+        self.status_signal.emit(logging.INFO, "Stop signal received")
         self.running = False
         self.recognition_running = False  # Stop recognition thread
+        self._stop_event.set()
 
     def _cleanup(self):
         """
@@ -529,23 +901,23 @@ class CameraWorker(QThread):
         Always called in finally block to ensure proper resource release.
         """
         try:
-            self.status_signal.emit("Cleaning up camera resources...")
+            self.status_signal.emit(logging.INFO, "Cleaning up camera resources...")
 
             # Stop recognition thread
             if self.recognition_thread and self.recognition_thread.is_alive():
                 self.recognition_running = False
                 self.recognition_thread.join(timeout=2.0)
-                self.status_signal.emit("Recognition thread stopped")
+                self.status_signal.emit(logging.INFO, "Recognition thread stopped")
 
             # Stop grabbing
             if self.camera.IMV_IsGrabbing():
                 ret = self.camera.IMV_StopGrabbing()
                 if ret == IMV_OK:
-                    self.status_signal.emit("Frame grabbing stopped")
+                    self.status_signal.emit(logging.INFO, "Frame grabbing stopped")
                 else:
-                    self.status_signal.emit(f"Stop grabbing error: {ret}")
+                    self.status_signal.emit(logging.ERROR, f"Stop grabbing error: {ret}")
 
-            self.status_signal.emit("Worker thread cleanup completed")
+            self.status_signal.emit(logging.INFO, "Worker thread cleanup completed")
 
         except Exception as e:
-            self.status_signal.emit(f"Cleanup error: {str(e)}")
+            self.status_signal.emit(logging.ERROR, f"Cleanup error: {str(e)}")
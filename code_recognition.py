@@ -109,7 +109,8 @@ class CodeRecognizer:
         Detect QR codes and barcodes in image with position information.
 
         Args:
-            image: OpenCV image (numpy array, BGR format)
+            image: OpenCV image (numpy array, grayscale or BGR format;
+                   grayscale avoids a conversion in each detector)
 
         Returns:
             tuple: (decoded_text, detections_list)